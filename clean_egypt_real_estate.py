@@ -1,91 +1,254 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import re
+import os
+from dataset_utils import downcast_room_counts, current_parquet_copy
 
-def clean_egypt_real_estate_data(input_file, output_file):
+# Explicit Arrow schema for the raw listings columns the cleaning depends on;
+# type and location are low-cardinality, so they are dictionary encoded
+RAW_COLUMN_TYPES = {
+    'price': pa.string(),
+    'type': pa.dictionary(pa.int32(), pa.string()),
+    'location': pa.dictionary(pa.int32(), pa.string()),
+    'bedrooms': pa.string(),
+    'bathrooms': pa.string(),
+    'size': pa.string()
+}
+
+# Strings that pd.to_numeric would accept as a plain decimal number
+NUMERIC_PATTERN = r'^[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?$'
+
+# Trailing "Maid" marker on room counts (e.g., "3+ Maid"); RE2 compiles it once per kernel call
+MAID_PATTERN = r'\s*\+?\s*Maid\s*$'
+
+def arrow_to_numeric(arr, index):
+    """
+    Vectorized equivalent of pd.to_numeric(..., errors='coerce') for an Arrow string array.
+    
+    Parameters:
+    arr (pa.Array): Arrow string array
+    index (pd.Index): Index of the resulting Series
+    
+    Returns:
+    pd.Series: float64 Series with NaN where the value is not numeric
+    """
+    arr = pc.utf8_trim_whitespace(arr)
+    numeric = pc.if_else(pc.match_substring_regex(arr, NUMERIC_PATTERN), arr, pa.scalar(None, pa.string()))
+    return pd.Series(pc.cast(numeric, pa.float64()).to_numpy(zero_copy_only=False), index=index)
+
+def extract_size_sqm(arr, index):
+    """
+    Extract the square-meter value from size strings (e.g., "1,787 sqft / 166 sqm").
+    
+    Parameters:
+    arr (pa.Array): Arrow string array of raw sizes
+    index (pd.Index): Index of the resulting Series
+    
+    Returns:
+    pd.Series: float32 Series with NaN where no sqm value is present
+    """
+    # One RE2 regex pass over the Arrow buffer, then strip thousands separators
+    sqm = pc.struct_field(pc.extract_regex(arr, r'(?P<sqm>\d+(?:,\d+)*)\s*sqm'), [0])
+    # float32 holds every whole sqm value up to 2**24 exactly
+    sqm = pc.cast(pc.replace_substring(sqm, ',', ''), pa.float32())
+    return pd.Series(sqm.to_numpy(zero_copy_only=False), index=index)
+
+def string_column(batch, name):
+    """
+    Return a column of an Arrow batch as Arrow strings.
+    
+    Parameters:
+    batch (pa.RecordBatch or pa.Table): Raw partition
+    name (str): Column name
+    
+    Returns:
+    pa.Array: Arrow string array (or chunked array) of the column
+    """
+    column = batch.column(name)
+    if pa.types.is_string(column.type):
+        return column
+    # Schema drift (e.g., an all-numeric column stored as int64 or float64):
+    # fall back to pandas to render the values as strings
+    values = column.to_pandas()
+    return pa.array(values.astype(str).where(values.notna()), type=pa.string(), from_pandas=True)
+
+# Misspelled property types mapped onto their standard form; trailing-space
+# variants (e.g., 'Villa ') are handled by stripping instead
+TYPE_MAPPING = {
+    'Appartment': 'Apartment',
+    'appartement': 'Apartment',
+    'Appartement': 'Apartment'
+}
+
+def standardize_types(types):
+    """
+    Strip trailing spaces from property types and merge misspelled variants.
+    
+    Parameters:
+    types (pd.Series): Categorical type column
+    
+    Returns:
+    pd.Series: Standardized type column
+    """
+    # Only the categories are rewritten, so the cost does not grow with the row count
+    categories = types.cat.categories
+    standard = pd.Series(categories.str.rstrip(), index=categories).replace(TYPE_MAPPING)
+    return types.map(standard)
+
+def iter_raw_partitions(input_file, block_size=64 << 20):
+    """
+    Read the raw dataset one partition at a time.
+    
+    Parameters:
+    input_file (str): Path to the input CSV or Parquet file
+    block_size (int): Approximate partition size in bytes for CSV input;
+                      Parquet input is read one row group at a time
+    
+    Yields:
+    pa.RecordBatch or pa.Table: Partition of the raw dataset
+    """
+    if input_file.endswith('.parquet'):
+        # type and location are low-cardinality, so they are read dictionary encoded
+        parquet = pq.ParquetFile(input_file, read_dictionary=['type', 'location'])
+        for i in range(parquet.num_row_groups):
+            yield parquet.read_row_group(i)
+    else:
+        # Arrow's streaming CSV parser; descriptions contain quoted newlines
+        reader = pacsv.open_csv(
+            input_file,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=block_size),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(column_types=RAW_COLUMN_TYPES,
+                                                 strings_can_be_null=True)
+        )
+        yield from reader
+
+def parse_fixed_columns(batch, index):
+    """
+    Parse price, bedrooms, bathrooms and size of one raw partition.
+    
+    The columns are parsed straight from the partition's Arrow buffers, so
+    no Python string objects are created for them.
+    
+    Parameters:
+    batch (pa.RecordBatch or pa.Table): Raw partition
+    index (pd.Index): Index of the partition's DataFrame
+    
+    Returns:
+    pd.DataFrame: Numeric price (NaN if invalid), bedrooms and bathrooms
+                  (NaN if missing), and size_sqm as float32
+    """
+    # Room counts lose their "+ Maid" suffix; their storage type is chosen
+    # once all partitions are combined, so every partition agrees on it
+    return pd.DataFrame({
+        'price': arrow_to_numeric(pc.replace_substring(string_column(batch, 'price'), ',', ''), index),
+        'bedrooms': arrow_to_numeric(
+            pc.replace_substring_regex(string_column(batch, 'bedrooms'), MAID_PATTERN, ''),
+            index),
+        'bathrooms': arrow_to_numeric(
+            pc.replace_substring_regex(string_column(batch, 'bathrooms'), MAID_PATTERN, ''),
+            index),
+        'size_sqm': extract_size_sqm(string_column(batch, 'size'), index),
+    })
+
+def clean_egypt_real_estate_data(input_file, output_file, block_size=64 << 20, write_csv=False):
     """
     Smart data cleaning function for Egypt real estate dataset.
     
+    The raw file is processed in partitions so only one raw partition is
+    resident at a time; the global steps (deduplication across partitions
+    and the price outlier bounds) run on compact per-row data.
+    
     Parameters:
-    input_file (str): Path to the input CSV file
-    output_file (str): Path to save the cleaned CSV file
+    input_file (str): Path to the input CSV or Parquet file
+    output_file (str): Path of the cleaned dataset; it is written as Parquet
+                       next to this path (same name, .parquet suffix)
+    block_size (int): Approximate partition size in bytes for CSV input
+    write_csv (bool): Also write the cleaned dataset as CSV to output_file
     
     Returns:
     pd.DataFrame: Cleaned dataframe
     """
     
-    # Load the dataset
+    # Load and clean the dataset partition by partition
     print("Loading dataset...")
-    df = pd.read_csv(input_file)
-    print(f"Original dataset shape: {df.shape}")
+    n_rows = n_unique = n_key = n_valid = 0
+    missing = None
+    seen_hashes = np.empty(0, dtype=np.uint64)
+    partitions = []
+    for batch in iter_raw_partitions(input_file, block_size):
+        part = batch.to_pandas()
+        part.index = pd.RangeIndex(n_rows, n_rows + len(part))
+        n_rows += len(part)
+        n_cols = part.shape[1]
+        part_missing = part.isnull().sum()
+        missing = part_missing if missing is None else missing + part_missing
+        parsed = parse_fixed_columns(batch, part.index)
+        del batch
+        
+        # Exact duplicates are found through 64-bit row hashes, both within the
+        # partition and against rows kept from earlier partitions
+        hashes = pd.util.hash_pandas_object(part, index=False).to_numpy()
+        repeat = pd.Series(hashes).duplicated().to_numpy() | np.isin(hashes, seen_hashes)
+        seen_hashes = np.concatenate([seen_hashes, hashes[~repeat]])
+        part = part.loc[~repeat]
+        parsed = parsed.loc[~repeat]
+        n_unique += len(part)
+        
+        # Rows with missing key data or an invalid price are dropped with one mask
+        key_mask = part['price'].notna() & part['type'].notna() & part['location'].notna()
+        valid_mask = key_mask & parsed['price'].notna()
+        n_key += int(key_mask.sum())
+        n_valid += int(valid_mask.sum())
+        
+        # Replace the raw columns with their parsed values and standardize
+        # property types in a single assign so the frame is copied once
+        partitions.append(part.loc[valid_mask].assign(**parsed.loc[valid_mask],
+                                                     type=lambda d: standardize_types(d['type'])))
+    
+    df_clean = pd.concat(partitions)
+    del partitions
+    print(f"Original dataset shape: {(n_rows, n_cols)}")
     
     # Display initial information
     print("\nDataset Info:")
-    print(f"Total rows: {len(df)}")
-    print(f"Total columns: {len(df.columns)}")
-    print(f"Missing values:\n{df.isnull().sum()}")
-    
-    # Remove exact duplicate rows
-    print("\nRemoving duplicate rows...")
-    df_clean = df.drop_duplicates()
-    print(f"Shape after removing duplicates: {df_clean.shape}")
-    
-    # Handle missing values in key columns
-    print("\nHandling missing values in key columns...")
-    # Remove rows where essential columns are missing
-    df_clean = df_clean[df_clean['price'].notnull() & 
-                       df_clean['type'].notnull() & 
-                       df_clean['location'].notnull()]
-    print(f"Shape after removing rows with missing key data: {df_clean.shape}")
-    
-    # Clean and convert price column
-    print("\nCleaning price column...")
-    # Remove commas and convert to numeric
-    df_clean['price'] = df_clean['price'].astype(str).str.replace(',', '')
-    df_clean['price'] = pd.to_numeric(df_clean['price'], errors='coerce')
-    
-    # Remove rows with invalid prices
-    df_clean = df_clean[df_clean['price'].notnull()]
-    df_clean['price'] = df_clean['price'].astype('int64')
+    print(f"Total rows: {n_rows}")
+    print(f"Total columns: {n_cols}")
+    print(f"Missing values:\n{missing}")
+    
+    # Duplicates, rows with missing key data and invalid prices were dropped,
+    # and the fixed columns parsed, in the partitioned pass above
+    print("\nRow counts from the partitioned loading pass, which also parsed price,")
+    print("bedrooms, bathrooms and size and standardized property types:")
+    # The first two filters ran on the raw columns; the rows that passed the
+    # price check are df_clean, which has the parsed size_sqm column too
+    print(f"Shape after removing duplicates: {(n_unique, n_cols)}")
+    print(f"Shape after removing rows with missing key data: {(n_key, n_cols)}")
     print(f"Shape after cleaning price column: {df_clean.shape}")
     
-    # Clean bedrooms and bathrooms columns
-    print("\nCleaning bedrooms and bathrooms columns...")
-    df_clean['bedrooms'] = df_clean['bedrooms'].astype(str).str.replace('+ Maid', '').str.replace(' Maid', '')
-    df_clean['bathrooms'] = df_clean['bathrooms'].astype(str).str.replace('+ Maid', '').str.replace(' Maid', '')
-    
-    # Convert to numeric where possible
-    df_clean['bedrooms'] = pd.to_numeric(df_clean['bedrooms'], errors='coerce')
-    df_clean['bathrooms'] = pd.to_numeric(df_clean['bathrooms'], errors='coerce')
-    
-    # Standardize property types
-    print("\nStandardizing property types...")
-    type_mapping = {
-        'Appartment': 'Apartment',
-        'appartement': 'Apartment',
-        'Appartement': 'Apartment',
-        'Chalet ': 'Chalet',
-        'Villa ': 'Villa',
-        'Duplex ': 'Duplex'
-    }
-    
-    df_clean['type'] = df_clean['type'].replace(type_mapping)
-    
-    # Clean size column and extract numeric values
-    print("\nCleaning size column...")
-    # Extract numeric values from size column (e.g., "1,787 sqft / 166 sqm")
-    df_clean['size_sqm'] = df_clean['size'].str.extract(r'(\d+(?:,\d+)*)\s*sqm')
-    df_clean['size_sqm'] = df_clean['size_sqm'].str.replace(',', '').astype(float)
-    
-    # Remove outliers in price (values beyond 3 standard deviations)
+    # Remove outliers in price (values outside the 0.15th-99.85th percentiles,
+    # the tail coverage of +/-3 standard deviations on a normal distribution,
+    # but not skewed by the extreme prices being removed)
     print("\nRemoving price outliers...")
-    price_mean = df_clean['price'].mean()
-    price_std = df_clean['price'].std()
-    lower_bound = price_mean - 3 * price_std
-    upper_bound = price_mean + 3 * price_std
+    lower_bound, upper_bound = np.percentile(df_clean['price'].to_numpy(), [0.15, 99.85])
     
-    df_clean = df_clean[(df_clean['price'] >= lower_bound) & 
-                       (df_clean['price'] <= upper_bound)]
+    # Partitions can carry different categories, so the categoricals are
+    # rebuilt and categories whose rows were all filtered out are dropped;
+    # price is stored in the smallest integer type that holds it (int32 here)
+    # and room counts as nullable Int8 when every count is a whole number that fits
+    df_clean = (
+        df_clean.loc[df_clean['price'].between(lower_bound, upper_bound)]
+        .astype({'price': 'int64', 'type': 'category', 'location': 'category'})
+        .assign(price=lambda d: pd.to_numeric(d['price'], downcast='integer'),
+                type=lambda d: d['type'].cat.remove_unused_categories(),
+                location=lambda d: d['location'].cat.remove_unused_categories(),
+                bedrooms=lambda d: downcast_room_counts(d['bedrooms']),
+                bathrooms=lambda d: downcast_room_counts(d['bathrooms']))
+    )
     print(f"Shape after removing outliers: {df_clean.shape}")
     
     # Final dataset info
@@ -107,9 +270,17 @@ def clean_egypt_real_estate_data(input_file, output_file):
     print(f"Mean price: {df_clean['price'].mean():,.2f}")
     print(f"Median price: {df_clean['price'].median():,.2f}")
     
-    # Save cleaned dataset
-    df_clean.to_csv(output_file, index=False)
-    print(f"\nCleaned dataset saved to: {output_file}")
+    # Save cleaned dataset as Parquet; dictionary encoding keeps the repeated
+    # type/location strings compact and readers skip text parsing entirely
+    parquet_file = os.path.splitext(output_file)[0] + '.parquet'
+    df_clean.to_parquet(parquet_file, index=False, compression='snappy',
+                        use_dictionary=True, row_group_size=50_000)
+    print(f"\nCleaned dataset saved to: {parquet_file}")
+    
+    if write_csv:
+        # Write in row batches to bound the size of the intermediate text buffer
+        df_clean.to_csv(output_file, index=False, chunksize=50_000)
+        print(f"Cleaned dataset saved to: {output_file}")
     
     return df_clean
 
@@ -166,7 +337,7 @@ def generate_data_quality_report(df, report_file):
         
         f.write("7. TOP 10 LOCATIONS\n")
         f.write("-" * 18 + "\n")
-        location_counts = df['location'].value_counts().head(10)
+        location_counts = df['location'].value_counts(sort=False).nlargest(10)
         for location, count in location_counts.items():
             f.write(f"{location}: {count}\n")
     
@@ -178,6 +349,10 @@ if __name__ == "__main__":
     output_file = "/Users/sittminthar/Desktop/BigData Dev/cleaned_egypt_real_estate.csv"
     report_file = "/Users/sittminthar/Desktop/BigData Dev/data_quality_report.txt"
     
+    # Convert the raw CSV to Parquet once, and again whenever the CSV file
+    # changes; other runs skip CSV parsing
+    input_file = current_parquet_copy(input_file)
+    
     # Clean the data
     cleaned_df = clean_egypt_real_estate_data(input_file, output_file)
     
@@ -1,48 +1,86 @@
 import pandas as pd
+import pyarrow.parquet as pq
 import os
+from concurrent.futures import ProcessPoolExecutor
 
-# Check all possible CSV files in the directory
-print("Checking all CSV files in the directory:")
-for file in os.listdir("/Users/sittminthar/Desktop/BigData Dev"):
-    if file.endswith(".csv"):
-        try:
-            filepath = os.path.join("/Users/sittminthar/Desktop/BigData Dev", file)
-            df = pd.read_csv(filepath)
-            missing_bedrooms = df['bedrooms'].isnull().sum() if 'bedrooms' in df.columns else 'N/A'
-            print(f"  {file}: {df.shape} - Missing bedrooms: {missing_bedrooms}")
-        except Exception as e:
-            print(f"  {file}: Error reading file - {e}")
-
-print("\nChecking specifically for the missing values pattern you mentioned:")
+data_dir = "/Users/sittminthar/Desktop/BigData Dev"
+
+# The missing values pattern to look for, as in the 19,327-row output of the
+# cleaners with percentile price bounds; these are the only columns read
 target_missing = {
     'description': 1,
-    'bedrooms': 432,
-    'bathrooms': 150,
-    'available_from': 533,
-    'payment_method': 1,
-    'down_payment': 13733
+    'bedrooms': 462,
+    'bathrooms': 194,
+    'available_from': 540,
+    'payment_method': 2,
+    'down_payment': 13889
 }
 
-for file in os.listdir("/Users/sittminthar/Desktop/BigData Dev"):
-    if file.endswith(".csv"):
-        try:
-            filepath = os.path.join("/Users/sittminthar/Desktop/BigData Dev", file)
-            df = pd.read_csv(filepath)
-            if all(col in df.columns for col in target_missing.keys()):
-                matches = True
-                for col, expected_missing in target_missing.items():
-                    actual_missing = df[col].isnull().sum()
-                    if actual_missing != expected_missing:
-                        matches = False
-                        break
-                
-                if matches:
-                    print(f"  FOUND MATCH: {file}")
-                    print(f"    Shape: {df.shape}")
-                    total_missing = df.isnull().sum().sum()
-                    print(f"    Total missing values: {total_missing}")
-                    break
-        except Exception as e:
+def read_target_columns(filepath):
+    """
+    Read only the target columns of a CSV or Parquet file.
+
+    Parameters:
+    filepath (str): Path to the CSV or Parquet file
+
+    Returns:
+    tuple: (DataFrame with the target columns present in the file, total number of columns)
+    """
+    if filepath.endswith(".parquet"):
+        all_columns = pq.read_schema(filepath).names
+    else:
+        all_columns = pd.read_csv(filepath, nrows=0).columns.tolist()
+
+    # Keep one column when none of the targets are present so the row count survives
+    columns = [col for col in all_columns if col in target_missing] or all_columns[:1]
+
+    if filepath.endswith(".parquet"):
+        df = pd.read_parquet(filepath, columns=columns)
+    else:
+        df = pd.read_csv(filepath, usecols=columns)
+    return df, len(all_columns)
+
+def check_file(filepath):
+    """
+    Read the target columns of one file and count their missing values.
+
+    Parameters:
+    filepath (str): Path to the CSV or Parquet file
+
+    Returns:
+    tuple: (shape of the file, dict of missing-value counts per target column present)
+    """
+    df, n_columns = read_target_columns(filepath)
+    missing = {col: int(df[col].isna().to_numpy().sum()) for col in df.columns if col in target_missing}
+    return (len(df), n_columns), missing
+
+if __name__ == "__main__":
+    files = [file for file in os.listdir(data_dir) if file.endswith((".csv", ".parquet"))]
+
+    # Check all possible CSV and Parquet files in the directory; each file is
+    # parsed once, in parallel across worker processes
+    print("Checking all CSV and Parquet files in the directory:")
+    results = {}
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(check_file, os.path.join(data_dir, file)) for file in files]
+        for file, future in zip(files, futures):
+            try:
+                shape, missing = future.result()
+                results[file] = (shape, missing)
+                print(f"  {file}: {shape} - Missing bedrooms: {missing.get('bedrooms', 'N/A')}")
+            except Exception as e:
+                print(f"  {file}: Error reading file - {e}")
+
+    print("\nChecking specifically for the missing values pattern you mentioned:")
+    min_rows = max(target_missing.values())
+    for file, (shape, missing) in results.items():
+        # A file with fewer rows than the largest expected count cannot match
+        if shape[0] < min_rows:
             continue
-else:
-    print("  No file found matching the missing values pattern.")
\ No newline at end of file
+        if missing == target_missing:
+            print(f"  FOUND MATCH: {file}")
+            print(f"    Shape: {shape}")
+            print(f"    Total missing values in target columns: {sum(missing.values())}")
+            break
+    else:
+        print("  No file found matching the missing values pattern.")
@@ -0,0 +1,136 @@
+import pandas as pd
+import numpy as np
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import os
+
+# Column dtypes applied on load by the fill, report and EDA scripts;
+# bedroom/bathroom medians can be fractional (e.g., 3.5), so room counts are
+# float32 rather than an integer type. price is not listed: it is downcast
+# to the smallest integer type that holds it (see downcast_price)
+SCHEMA = {
+    'size_sqm': 'float32',
+    'bedrooms': 'float32',
+    'bathrooms': 'float32',
+    'type': 'category',
+    'location': 'category',
+    'payment_method': 'category',
+    'available_from': 'category'
+}
+
+def downcast_price(prices):
+    """
+    Store prices in the smallest integer type that holds every one of them.
+    
+    Parameters:
+    prices (pd.Series): Numeric price column
+    
+    Returns:
+    pd.Series: Integer price column, or float64 when a price is missing or fractional
+    """
+    # Unlike a fixed astype('int32'), to_numeric only downcasts when every
+    # value fits, so large prices cannot wrap around and NaN cannot raise
+    return pd.to_numeric(prices, downcast='integer')
+
+def downcast_room_counts(counts):
+    """
+    Store room counts as nullable Int8 when every count is a whole number that fits in it.
+    
+    Parameters:
+    counts (pd.Series): Numeric bedroom or bathroom counts, NaN where missing
+    
+    Returns:
+    pd.Series: Int8 room counts, or float32 when a count is fractional or out of the Int8 range
+    """
+    values = counts.to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[~np.isnan(values)]
+    int8 = np.iinfo(np.int8)
+    if (values % 1 == 0).all() and ((values >= int8.min) & (values <= int8.max)).all():
+        return counts.astype('Int8')
+    # Checked first because astype('Int8') raises on fractional counts and
+    # wraps around on counts above 127
+    return counts.astype('float32')
+
+def convert_csv_to_parquet(csv_file, parquet_file=None):
+    """
+    Convert a CSV file to Snappy-compressed Parquet.
+    
+    Parameters:
+    csv_file (str): Path to the input CSV file
+    parquet_file (str): Path to save the Parquet file (defaults to the CSV path with a .parquet suffix)
+    
+    Returns:
+    str: Path to the Parquet file
+    """
+    if parquet_file is None:
+        parquet_file = os.path.splitext(csv_file)[0] + '.parquet'
+    
+    pd.read_csv(csv_file).to_parquet(parquet_file, compression='snappy', index=False)
+    print(f"Converted {csv_file} to {parquet_file}")
+    return parquet_file
+
+def current_parquet_copy(csv_file):
+    """
+    Return the Parquet copy of a CSV file, converting the CSV again when the copy is missing or older.
+    
+    Parameters:
+    csv_file (str): Path to the CSV file
+    
+    Returns:
+    str: Path to the Parquet copy (same name, .parquet suffix)
+    """
+    parquet_file = os.path.splitext(csv_file)[0] + '.parquet'
+    # A replaced or re-scraped CSV file is newer than its copy, so the copy is
+    # rebuilt rather than the old data being cleaned again
+    if not os.path.exists(parquet_file) or (
+            os.path.exists(csv_file) and os.path.getmtime(csv_file) > os.path.getmtime(parquet_file)):
+        convert_csv_to_parquet(csv_file, parquet_file)
+    return parquet_file
+
+def load_dataset(input_file):
+    """
+    Load a dataset, preferring its Parquet copy when one exists next to the CSV file.
+    
+    Parameters:
+    input_file (str): Path to the CSV file
+    
+    Returns:
+    tuple: (DataFrame with the SCHEMA dtypes applied, missing-value count per column)
+    """
+    parquet_file = os.path.splitext(input_file)[0] + '.parquet'
+    if os.path.exists(parquet_file):
+        table = pq.read_table(parquet_file)
+    else:
+        # Arrow's multithreaded parser; descriptions contain quoted newlines
+        table = pacsv.read_csv(
+            input_file,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(strings_can_be_null=True)
+        )
+    # Null counts are stored with each Arrow column, so no scan is needed
+    missing = pd.Series({name: table.column(name).null_count for name in table.column_names})
+    df = table.to_pandas()
+    df = df.astype({col: dtype for col, dtype in SCHEMA.items() if col in df.columns})
+    if 'price' in df.columns:
+        df['price'] = downcast_price(df['price'])
+    return df, missing
+
+def format_report_lines(values, value_format, total=None):
+    """
+    Format labelled values as report lines, "label: value" or "label: value (percentage%)".
+    
+    Parameters:
+    values (pd.Series): Value per label
+    value_format (str): Format string applied to each value
+    total (int): Total the percentages are taken of; no percentage is shown when None
+    
+    Returns:
+    str: One line per label, each ending in a newline
+    """
+    # The lines are built column-wise with vectorized string concatenation
+    lines = values.index.astype(str) + ": " + values.map(value_format.format).to_numpy(dtype=object)
+    if total is not None:
+        percentages = ((values / total) * 100).map('{:.2f}'.format).to_numpy(dtype=object)
+        lines = lines + " (" + percentages + "%)"
+    return "".join(lines + "\n")
@@ -1,234 +1,261 @@
 import pandas as pd
 import numpy as np
 import re
+import os
 from datetime import datetime
+from dataset_utils import downcast_room_counts, current_parquet_copy
 
-def detailed_clean_egypt_real_estate_data(input_file, output_file, log_file):
+# Trailing "Maid" marker on room counts (e.g., "3+ Maid"), compiled once
+_MAID_RE = re.compile(r'\s*\+?\s*Maid\s*$')
+
+def detailed_clean_egypt_real_estate_data(input_file, output_file, log_file, write_csv=False):
     """
     Detailed data cleaning function for Egypt real estate dataset with comprehensive logging.
     
     Parameters:
-    input_file (str): Path to the input CSV file
-    output_file (str): Path to save the cleaned CSV file
+    input_file (str): Path to the input CSV or Parquet file
+    output_file (str): Path of the cleaned dataset; it is written as Parquet
+                       next to this path (same name, .parquet suffix)
     log_file (str): Path to save the detailed log file
+    write_csv (bool): Also write the cleaned dataset as CSV to output_file
     
     Returns:
     pd.DataFrame: Cleaned dataframe
     """
     
-    # Initialize log file
-    with open(log_file, 'w') as f:
-        f.write(f"EGYPT REAL ESTATE DATA CLEANING LOG\n")
-        f.write(f"===================================\n")
-        f.write(f"Start time: {datetime.now()}\n")
-        f.write(f"Input file: {input_file}\n")
-        f.write(f"Output file: {output_file}\n\n")
-    
-    # Load the dataset
-    log_message("Loading dataset...", log_file)
-    df = pd.read_csv(input_file)
-    log_message(f"Original dataset shape: {df.shape}", log_file)
-    
-    # Display initial information
-    log_message("\nDataset Info:", log_file)
-    log_message(f"Total rows: {len(df)}", log_file)
-    log_message(f"Total columns: {len(df.columns)}", log_file)
-    log_message("Missing values:", log_file)
-    missing_values = df.isnull().sum()
-    for col, count in missing_values.items():
-        log_message(f"  {col}: {count}", log_file)
-    
-    # Check for exact duplicates
-    log_message("\nChecking for exact duplicates...", log_file)
-    duplicates = df[df.duplicated(keep=False)]
-    log_message(f"Number of duplicate rows found: {len(duplicates)}", log_file)
-    
-    if len(duplicates) > 0:
-        # Save duplicates to log file
-        duplicates_log_file = output_file.replace('.csv', '_duplicates.csv')
-        duplicates.to_csv(duplicates_log_file, index=False)
-        log_message(f"Duplicate rows saved to: {duplicates_log_file}", log_file)
+    # Open the log once with a large buffer; every message goes through this handle
+    with open(log_file, 'w', buffering=64 * 1024) as log:
+        log.write(f"EGYPT REAL ESTATE DATA CLEANING LOG\n")
+        log.write(f"===================================\n")
+        log.write(f"Start time: {datetime.now()}\n")
+        log.write(f"Input file: {input_file}\n")
+        log.write(f"Output file: {output_file}\n\n")
+    
+        # Load the dataset
+        log_message("Loading dataset...", log)
+        if input_file.endswith('.parquet'):
+            df = pd.read_parquet(input_file)
+        else:
+            df = pd.read_csv(input_file)
+        log_message(f"Original dataset shape: {df.shape}", log)
+    
+        # Display initial information
+        log_message("\nDataset Info:", log)
+        log_message(f"Total rows: {len(df)}", log)
+        log_message(f"Total columns: {len(df.columns)}", log)
+        log_message("Missing values:", log)
+        missing_values = df.isnull().sum()
+        log_message("\n".join(f"  {col}: {count}" for col, count in missing_values.items()), log)
+    
+        # Check for exact duplicates
+        log_message("\nChecking for exact duplicates...", log)
+        # A single hash pass marks every repeat of an earlier row; the full set of
+        # rows involved in duplication is only built when there is something to log
+        repeat_mask = df.duplicated(keep='first')
+        if repeat_mask.any():
+            duplicates = df.loc[df.duplicated(keep=False)]
+        else:
+            duplicates = df.iloc[0:0]
+        log_message(f"Number of duplicate rows found: {len(duplicates)}", log)
+    
+        if len(duplicates) > 0:
+            # Save duplicates to log file
+            duplicates_log_file = output_file.replace('.csv', '_duplicates.csv')
+            duplicates.to_csv(duplicates_log_file, index=False)
+            log_message(f"Duplicate rows saved to: {duplicates_log_file}", log)
         
-        # Show sample duplicates in log
-        log_message("Sample duplicate rows:", log_file)
-        log_message(duplicates.head().to_string(), log_file)
-    
-    # Remove exact duplicate rows
-    log_message("\nRemoving duplicate rows...", log_file)
-    df_clean = df.drop_duplicates()
-    log_message(f"Shape after removing duplicates: {df_clean.shape}", log_file)
-    log_message(f"Removed {len(df) - len(df_clean)} duplicate rows", log_file)
-    
-    # Handle missing values in key columns
-    log_message("\nHandling missing values in key columns...", log_file)
-    # Identify rows with missing key data
-    missing_key_data = df_clean[df_clean['price'].isnull() | 
-                               df_clean['type'].isnull() | 
-                               df_clean['location'].isnull()]
-    
-    log_message(f"Rows with missing key data (price/type/location): {len(missing_key_data)}", log_file)
-    
-    if len(missing_key_data) > 0:
-        # Save rows with missing key data
-        missing_key_log_file = output_file.replace('.csv', '_missing_key_data.csv')
-        missing_key_data.to_csv(missing_key_log_file, index=False)
-        log_message(f"Rows with missing key data saved to: {missing_key_log_file}", log_file)
+            # Show sample duplicates in log
+            log_message("Sample duplicate rows:", log)
+            log_message(duplicates.head().to_string(), log)
+    
+        # Remove exact duplicate rows, reusing the mask from the check above
+        log_message("\nRemoving duplicate rows...", log)
+        df_clean = df.loc[~repeat_mask]
+        log_message(f"Shape after removing duplicates: {df_clean.shape}", log)
+        log_message(f"Removed {len(df) - len(df_clean)} duplicate rows", log)
+    
+        # Handle missing values in key columns
+        log_message("\nHandling missing values in key columns...", log)
+        # Identify rows with missing key data
+        missing_key_data = df_clean[df_clean['price'].isnull() | 
+                                   df_clean['type'].isnull() | 
+                                   df_clean['location'].isnull()]
+    
+        log_message(f"Rows with missing key data (price/type/location): {len(missing_key_data)}", log)
+    
+        if len(missing_key_data) > 0:
+            # Save rows with missing key data
+            missing_key_log_file = output_file.replace('.csv', '_missing_key_data.csv')
+            missing_key_data.to_csv(missing_key_log_file, index=False)
+            log_message(f"Rows with missing key data saved to: {missing_key_log_file}", log)
         
-        # Show sample rows with missing key data
-        log_message("Sample rows with missing key data:", log_file)
-        log_message(missing_key_data.head().to_string(), log_file)
-    
-    # Remove rows where essential columns are missing
-    df_clean = df_clean[df_clean['price'].notnull() & 
-                       df_clean['type'].notnull() & 
-                       df_clean['location'].notnull()]
-    log_message(f"Shape after removing rows with missing key data: {df_clean.shape}", log_file)
-    
-    # Clean and convert price column
-    log_message("\nCleaning price column...", log_file)
-    # Check for non-standard price formats
-    original_price = df_clean['price'].copy()
-    df_clean['price'] = df_clean['price'].astype(str).str.replace(',', '')
-    
-    # Identify rows with invalid price formats
-    invalid_prices = pd.to_numeric(df_clean['price'], errors='coerce').isnull() & (df_clean['price'] != 'nan')
-    invalid_price_rows = df_clean[invalid_prices]
-    log_message(f"Rows with invalid price formats: {len(invalid_price_rows)}", log_file)
-    
-    if len(invalid_price_rows) > 0:
-        # Save rows with invalid price formats
-        invalid_price_log_file = output_file.replace('.csv', '_invalid_prices.csv')
-        invalid_price_rows.to_csv(invalid_price_log_file, index=False)
-        log_message(f"Rows with invalid price formats saved to: {invalid_price_log_file}", log_file)
+            # Show sample rows with missing key data
+            log_message("Sample rows with missing key data:", log)
+            log_message(missing_key_data.head().to_string(), log)
+    
+        # Remove rows where essential columns are missing
+        df_clean = df_clean[df_clean['price'].notnull() & 
+                           df_clean['type'].notnull() & 
+                           df_clean['location'].notnull()]
+        log_message(f"Shape after removing rows with missing key data: {df_clean.shape}", log)
+    
+        # Clean and convert price column
+        log_message("\nCleaning price column...", log)
+        # Check for non-standard price formats
+        df_clean['price'] = df_clean['price'].astype(str).str.replace(',', '')
+    
+        # Identify rows with invalid price formats
+        invalid_prices = pd.to_numeric(df_clean['price'], errors='coerce').isnull() & (df_clean['price'] != 'nan')
+        invalid_price_rows = df_clean[invalid_prices]
+        log_message(f"Rows with invalid price formats: {len(invalid_price_rows)}", log)
+    
+        if len(invalid_price_rows) > 0:
+            # Save rows with invalid price formats
+            invalid_price_log_file = output_file.replace('.csv', '_invalid_prices.csv')
+            invalid_price_rows.to_csv(invalid_price_log_file, index=False)
+            log_message(f"Rows with invalid price formats saved to: {invalid_price_log_file}", log)
         
-        # Show sample rows with invalid prices
-        log_message("Sample rows with invalid price formats:", log_file)
-        log_message(invalid_price_rows.head().to_string(), log_file)
-    
-    # Convert to numeric
-    df_clean['price'] = pd.to_numeric(df_clean['price'], errors='coerce')
-    
-    # Remove rows with invalid prices
-    valid_price_rows = df_clean[df_clean['price'].notnull()]
-    log_message(f"Rows with valid prices: {len(valid_price_rows)}", log_file)
-    invalid_price_count = len(df_clean) - len(valid_price_rows)
-    log_message(f"Rows with invalid prices to be removed: {invalid_price_count}", log_file)
-    
-    df_clean = valid_price_rows
-    df_clean['price'] = df_clean['price'].astype('int64')
-    log_message(f"Shape after cleaning price column: {df_clean.shape}", log_file)
-    
-    # Clean bedrooms and bathrooms columns
-    log_message("\nCleaning bedrooms and bathrooms columns...", log_file)
-    original_bedrooms = df_clean['bedrooms'].copy()
-    original_bathrooms = df_clean['bathrooms'].copy()
-    
-    df_clean['bedrooms'] = df_clean['bedrooms'].astype(str).str.replace('+ Maid', '').str.replace(' Maid', '').str.strip()
-    df_clean['bathrooms'] = df_clean['bathrooms'].astype(str).str.replace('+ Maid', '').str.replace(' Maid', '').str.strip()
-    
-    # Identify rows with non-numeric values after cleaning
-    df_clean['bedrooms'] = pd.to_numeric(df_clean['bedrooms'], errors='coerce')
-    df_clean['bathrooms'] = pd.to_numeric(df_clean['bathrooms'], errors='coerce')
-    
-    # Convert to numeric where possible
-    non_numeric_bedrooms = df_clean['bedrooms'].isnull() & (original_bedrooms != 'nan')
-    non_numeric_bathrooms = df_clean['bathrooms'].isnull() & (original_bathrooms != 'nan')
-    
-    log_message(f"Rows with non-numeric bedrooms: {non_numeric_bedrooms.sum()}", log_file)
-    log_message(f"Rows with non-numeric bathrooms: {non_numeric_bathrooms.sum()}", log_file)
-    
-    # Standardize property types
-    log_message("\nStandardizing property types...", log_file)
-    original_types = df_clean['type'].copy()
-    type_mapping = {
-        'Appartment': 'Apartment',
-        'appartement': 'Apartment',
-        'Appartement': 'Apartment',
-        'Chalet ': 'Chalet',
-        'Villa ': 'Villa',
-        'Duplex ': 'Duplex'
-    }
-    
-    df_clean['type'] = df_clean['type'].replace(type_mapping)
-    
-    # Count changes
-    type_changes = (original_types != df_clean['type']).sum()
-    log_message(f"Property type standardizations made: {type_changes}", log_file)
-    
-    # Clean size column and extract numeric values
-    log_message("\nCleaning size column...", log_file)
-    # Extract numeric values from size column (e.g., "1,787 sqft / 166 sqm")
-    df_clean['size_sqm'] = df_clean['size'].str.extract(r'(\d+(?:,\d+)*)\s*sqm')
-    df_clean['size_sqm'] = df_clean['size_sqm'].str.replace(',', '').astype(float)
-    
-    # Remove outliers in price (values beyond 3 standard deviations)
-    log_message("\nRemoving price outliers...", log_file)
-    price_mean = df_clean['price'].mean()
-    price_std = df_clean['price'].std()
-    lower_bound = price_mean - 3 * price_std
-    upper_bound = price_mean + 3 * price_std
-    
-    outliers = df_clean[(df_clean['price'] < lower_bound) | 
-                       (df_clean['price'] > upper_bound)]
-    
-    log_message(f"Price outliers found: {len(outliers)}", log_file)
-    log_message(f"Price range: {price_mean - 3 * price_std:,.2f} to {price_mean + 3 * price_std:,.2f}", log_file)
-    
-    if len(outliers) > 0:
-        # Save outliers
-        outliers_log_file = output_file.replace('.csv', '_price_outliers.csv')
-        outliers.to_csv(outliers_log_file, index=False)
-        log_message(f"Price outliers saved to: {outliers_log_file}", log_file)
+            # Show sample rows with invalid prices
+            log_message("Sample rows with invalid price formats:", log)
+            log_message(invalid_price_rows.head().to_string(), log)
+    
+        # Convert to numeric
+        df_clean['price'] = pd.to_numeric(df_clean['price'], errors='coerce')
+    
+        # Remove rows with invalid prices
+        valid_price_rows = df_clean[df_clean['price'].notnull()]
+        log_message(f"Rows with valid prices: {len(valid_price_rows)}", log)
+        invalid_price_count = len(df_clean) - len(valid_price_rows)
+        log_message(f"Rows with invalid prices to be removed: {invalid_price_count}", log)
+    
+        df_clean = valid_price_rows
+        # Smallest integer type that holds every price (int32 here)
+        df_clean['price'] = pd.to_numeric(df_clean['price'].astype('int64'), downcast='integer')
+        log_message(f"Shape after cleaning price column: {df_clean.shape}", log)
+    
+        # Clean bedrooms and bathrooms columns
+        log_message("\nCleaning bedrooms and bathrooms columns...", log)
+        # Only whether a value was present is needed later, so keep a boolean
+        # mask rather than a copy of each column
+        bedrooms_present = df_clean['bedrooms'].notna().to_numpy()
+        bathrooms_present = df_clean['bathrooms'].notna().to_numpy()
+    
+        # One regex pass per column strips the "+ Maid" suffix
+        df_clean['bedrooms'] = df_clean['bedrooms'].astype(str).str.replace(_MAID_RE, '', regex=True).str.strip()
+        df_clean['bathrooms'] = df_clean['bathrooms'].astype(str).str.replace(_MAID_RE, '', regex=True).str.strip()
+    
+        # Identify rows with non-numeric values after cleaning
+        df_clean['bedrooms'] = pd.to_numeric(df_clean['bedrooms'], errors='coerce')
+        df_clean['bathrooms'] = pd.to_numeric(df_clean['bathrooms'], errors='coerce')
+    
+        # Room counts are usually small whole numbers, so they are stored as
+        # nullable Int8 unless a count is fractional or too large for it
+        df_clean['bedrooms'] = downcast_room_counts(df_clean['bedrooms'])
+        df_clean['bathrooms'] = downcast_room_counts(df_clean['bathrooms'])
+    
+        # Convert to numeric where possible
+        non_numeric_bedrooms = df_clean['bedrooms'].isnull().to_numpy() & bedrooms_present
+        non_numeric_bathrooms = df_clean['bathrooms'].isnull().to_numpy() & bathrooms_present
+    
+        log_message(f"Rows with non-numeric bedrooms: {non_numeric_bedrooms.sum()}", log)
+        log_message(f"Rows with non-numeric bathrooms: {non_numeric_bathrooms.sum()}", log)
+    
+        # Standardize property types
+        log_message("\nStandardizing property types...", log)
+        # Trailing-space variants (e.g., 'Villa ') are stripped; only the
+        # misspellings need a mapping
+        type_mapping = {
+            'Appartment': 'Apartment',
+            'appartement': 'Apartment',
+            'Appartement': 'Apartment'
+        }
+    
+        standardized_types = df_clean['type'].str.rstrip().replace(type_mapping)
+    
+        # Count changes before the column is replaced, so no copy of the original is kept
+        type_changes = (standardized_types != df_clean['type']).sum()
+        df_clean['type'] = standardized_types
+        log_message(f"Property type standardizations made: {type_changes}", log)
+    
+        # Clean size column and extract numeric values
+        log_message("\nCleaning size column...", log)
+        # Extract numeric values from size column (e.g., "1,787 sqft / 166 sqm")
+        df_clean['size_sqm'] = df_clean['size'].str.extract(r'(\d+(?:,\d+)*)\s*sqm')
+        df_clean['size_sqm'] = df_clean['size_sqm'].str.replace(',', '').astype('float32')
+    
+        # Remove outliers in price (values outside the 0.15th-99.85th percentiles,
+        # the tail coverage of +/-3 standard deviations on a normal distribution,
+        # but not skewed by the extreme prices being removed)
+        log_message("\nRemoving price outliers...", log)
+        lower_bound, upper_bound = np.percentile(df_clean['price'].to_numpy(), [0.15, 99.85])
+    
+        outliers = df_clean[(df_clean['price'] < lower_bound) | 
+                           (df_clean['price'] > upper_bound)]
+    
+        log_message(f"Price outliers found: {len(outliers)}", log)
+        log_message(f"Price range: {lower_bound:,.2f} to {upper_bound:,.2f}", log)
+    
+        if len(outliers) > 0:
+            # Save outliers
+            outliers_log_file = output_file.replace('.csv', '_price_outliers.csv')
+            outliers.to_csv(outliers_log_file, index=False)
+            log_message(f"Price outliers saved to: {outliers_log_file}", log)
         
-        # Show sample outliers
-        log_message("Sample price outliers:", log_file)
-        log_message(outliers.head().to_string(), log_file)
-    
-    df_clean = df_clean[(df_clean['price'] >= lower_bound) & 
-                       (df_clean['price'] <= upper_bound)]
-    log_message(f"Shape after removing outliers: {df_clean.shape}", log_file)
-    
-    # Final dataset info
-    log_message("\nCleaned Dataset Info:", log_file)
-    log_message(f"Final shape: {df_clean.shape}", log_file)
-    log_message("Missing values in key columns:", log_file)
-    log_message(f"- Price: {df_clean['price'].isnull().sum()}", log_file)
-    log_message(f"- Type: {df_clean['type'].isnull().sum()}", log_file)
-    log_message(f"- Location: {df_clean['location'].isnull().sum()}", log_file)
-    log_message(f"- Bedrooms: {df_clean['bedrooms'].isnull().sum()}", log_file)
-    log_message(f"- Bathrooms: {df_clean['bathrooms'].isnull().sum()}", log_file)
-    
-    log_message("\nProperty type distribution:", log_file)
-    type_counts = df_clean['type'].value_counts()
-    for property_type, count in type_counts.items():
-        log_message(f"  {property_type}: {count}", log_file)
-    
-    log_message("\nPrice statistics:", log_file)
-    log_message(f"  Min price: {df_clean['price'].min():,}", log_file)
-    log_message(f"  Max price: {df_clean['price'].max():,}", log_file)
-    log_message(f"  Mean price: {df_clean['price'].mean():,.2f}", log_file)
-    log_message(f"  Median price: {df_clean['price'].median():,.2f}", log_file)
-    
-    # Save cleaned dataset
-    df_clean.to_csv(output_file, index=False)
-    log_message(f"\nCleaned dataset saved to: {output_file}", log_file)
-    
-    # Log completion time
-    log_message(f"\nData cleaning process completed at: {datetime.now()}", log_file)
-    
-    return df_clean
+            # Show sample outliers
+            log_message("Sample price outliers:", log)
+            log_message(outliers.head().to_string(), log)
+    
+        df_clean = df_clean[(df_clean['price'] >= lower_bound) & 
+                           (df_clean['price'] <= upper_bound)]
+        log_message(f"Shape after removing outliers: {df_clean.shape}", log)
+    
+        # Final dataset info
+        log_message("\nCleaned Dataset Info:", log)
+        log_message(f"Final shape: {df_clean.shape}", log)
+        log_message("Missing values in key columns:", log)
+        log_message(f"- Price: {df_clean['price'].isnull().sum()}", log)
+        log_message(f"- Type: {df_clean['type'].isnull().sum()}", log)
+        log_message(f"- Location: {df_clean['location'].isnull().sum()}", log)
+        log_message(f"- Bedrooms: {df_clean['bedrooms'].isnull().sum()}", log)
+        log_message(f"- Bathrooms: {df_clean['bathrooms'].isnull().sum()}", log)
+    
+        log_message("\nProperty type distribution:", log)
+        type_counts = df_clean['type'].value_counts()
+        log_message("\n".join(f"  {property_type}: {count}" for property_type, count in type_counts.items()), log)
+    
+        log_message("\nPrice statistics:", log)
+        log_message(f"  Min price: {df_clean['price'].min():,}", log)
+        log_message(f"  Max price: {df_clean['price'].max():,}", log)
+        log_message(f"  Mean price: {df_clean['price'].mean():,.2f}", log)
+        log_message(f"  Median price: {df_clean['price'].median():,.2f}", log)
+    
+        # Save cleaned dataset as Parquet; dictionary encoding keeps the repeated
+        # type/location strings compact and readers skip text parsing entirely
+        parquet_file = os.path.splitext(output_file)[0] + '.parquet'
+        df_clean.to_parquet(parquet_file, index=False, compression='snappy',
+                            use_dictionary=True, row_group_size=50_000)
+        log_message(f"\nCleaned dataset saved to: {parquet_file}", log)
+    
+        if write_csv:
+            df_clean.to_csv(output_file, index=False)
+            log_message(f"Cleaned dataset saved to: {output_file}", log)
+    
+        # Log completion time
+        log_message(f"\nData cleaning process completed at: {datetime.now()}", log)
+    
+        return df_clean
 
-def log_message(message, log_file):
+def log_message(message, log):
     """
     Write message to both console and log file.
     
     Parameters:
     message (str): Message to log
-    log_file (str): Path to log file
+    log (file): Open handle of the log file
     """
     print(message)
-    with open(log_file, 'a') as f:
-        f.write(message + '\n')
+    log.write(message)
+    log.write('\n')
 
 if __name__ == "__main__":
     # Define input and output file paths
@@ -236,9 +263,14 @@ if __name__ == "__main__":
     output_file = "/Users/sittminthar/Desktop/BigData Dev/detailed_cleaned_egypt_real_estate.csv"
     log_file = "/Users/sittminthar/Desktop/BigData Dev/detailed_cleaning_log.txt"
     
-    # Clean the data
-    cleaned_df = detailed_clean_egypt_real_estate_data(input_file, output_file, log_file)
+    # Read the Parquet copy of the raw dataset, converted again whenever the
+    # CSV file changes
+    input_file = current_parquet_copy(input_file)
+    
+    # Clean the data; the CSV copy is still written for the downstream scripts
+    cleaned_df = detailed_clean_egypt_real_estate_data(input_file, output_file, log_file, write_csv=True)
     
     print(f"\nDetailed data cleaning process completed successfully!")
+    print(f"Cleaned dataset saved to: {os.path.splitext(output_file)[0]}.parquet")
     print(f"Cleaned dataset saved to: {output_file}")
     print(f"Detailed log saved to: {log_file}")
\ No newline at end of file
@@ -1,44 +1,73 @@
-import pandas as pd
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import os
 
 def load_data():
-    """Replicate the exact loading function from the dashboard"""
-    # Try to load data with different possible paths
-    possible_paths = [
+    """Replicate the exact loading order of the dashboard app"""
+    # Candidate files in the app's priority order, each looked up in these
+    # directories; like the app, the Parquet copy written next to a CSV file
+    # is read in its place
+    candidates = [
         "latest_cleaned_egypt_real_estate.csv",
-        "/Users/sittminthar/Desktop/BigData Dev/latest_cleaned_egypt_real_estate.csv",
-        "filled_egypt_real_estate.csv",
-        "/Users/sittminthar/Desktop/BigData Dev/filled_egypt_real_estate.csv",
-        "detailed_cleaned_egypt_real_estate.csv",
-        "/Users/sittminthar/Desktop/BigData Dev/detailed_cleaned_egypt_real_estate.csv",
-        "cleaned_egypt_real_estate.csv",
-        "/Users/sittminthar/Desktop/BigData Dev/cleaned_egypt_real_estate.csv"
+        "detailed_cleaned_egypt_real_estate.csv"
     ]
-    
+    directories = ["", "/Users/sittminthar/Desktop/BigData Dev", os.path.dirname(__file__)]
+    parquet_copies = {name: os.path.splitext(name)[0] + ".parquet" for name in candidates}
+
+    # List each directory once instead of probing every candidate path
+    wanted = set(candidates) | set(parquet_copies.values())
+    present = {}
+    for directory in directories:
+        try:
+            with os.scandir(directory or ".") as entries:
+                present[directory] = {entry.name for entry in entries if entry.name in wanted}
+        except OSError:
+            present[directory] = set()
+
     df = None
     loaded_file = None
-    for path in possible_paths:
-        try:
-            if os.path.exists(path):
-                df = pd.read_csv(path)
+    for name in candidates:
+        for directory in directories:
+            if parquet_copies[name] in present[directory]:
+                name_found = parquet_copies[name]
+            elif name in present[directory]:
+                name_found = name
+            else:
+                print(f"File not found: {os.path.join(directory, name)}")
+                continue
+            path = os.path.join(directory, name_found)
+            try:
+                if path.endswith(".parquet"):
+                    table = pq.read_table(path)
+                else:
+                    # Arrow's threaded reader; descriptions contain quoted newlines
+                    table = pacsv.read_csv(
+                        path,
+                        read_options=pacsv.ReadOptions(use_threads=True),
+                        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                        convert_options=pacsv.ConvertOptions(strings_can_be_null=True)
+                    )
+                df = table.to_pandas()
                 loaded_file = path
                 print(f"Successfully loaded: {path}")
                 print(f"Dataset shape: {df.shape}")
-                print(f"Missing values: {df.isnull().sum().sum()}")
-                
+
+                # Null counts are stored with each Arrow column, so no scan is needed
+                null_counts = {col: table.column(col).null_count for col in table.column_names}
+                print(f"Missing values: {sum(null_counts.values())}")
+
                 # Show specific column missing values
                 print("\nMissing values by column:")
-                for col in df.columns:
-                    missing_count = df[col].isnull().sum()
+                for col, missing_count in null_counts.items():
                     if missing_count > 0:
                         print(f"  {col}: {missing_count}")
                 break
-            else:
-                print(f"File not found: {path}")
-        except Exception as e:
-            print(f"Error loading {path}: {e}")
-            continue
-            
+            except Exception as e:
+                print(f"Error loading {path}: {e}")
+                continue
+        if df is not None:
+            break
+
     if df is None:
         print("No dataset file found!")
         return None
@@ -1,8 +1,15 @@
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Plots are only written to files, so no GUI backend is needed
 import matplotlib.pyplot as plt
 import seaborn as sns
+import os
+import hashlib
+import types
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from dataset_utils import load_dataset, format_report_lines
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -10,333 +17,605 @@ warnings.filterwarnings('ignore')
 plt.style.use('seaborn-v0_8')
 sns.set_palette("Blues_r")  # Reversed blues for better contrast
 
+# Resolution of the saved plots; the dashboard shows them scaled down to its
+# grid cells, which are smaller than the plots at this resolution
+SAVE_DPI = 150
+
+def pairwise_corr(numeric_df):
+    """
+    Pearson correlation matrix over pairwise-complete observations, like DataFrame.corr().
+    
+    Parameters:
+    numeric_df (pd.DataFrame): Numeric columns, possibly with missing values
+    
+    Returns:
+    pd.DataFrame: Correlation matrix
+    """
+    values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+    present = ~np.isnan(values)
+    # Centering first keeps the sums of squares well conditioned
+    values = np.where(present, values - np.nanmean(values, axis=0), 0.0)
+    mask = present.astype(np.float64)
+    
+    # Every pairwise sum comes from one BLAS matrix product; entry [i, j] of
+    # sum_x is the sum of column i over the rows where column j is present too
+    n = mask.T @ mask
+    sum_x = values.T @ mask
+    sum_x2 = (values ** 2).T @ mask
+    sum_xy = values.T @ values
+    
+    cov = sum_xy - sum_x * sum_x.T / n
+    var = sum_x2 - sum_x ** 2 / n
+    corr = cov / np.sqrt(var * var.T)
+    return pd.DataFrame(corr, index=numeric_df.columns, columns=numeric_df.columns)
+
+def save_figure(fig, path):
+    """
+    Save a figure to a PNG file and clear it for the next plot.
+    
+    Parameters:
+    fig (matplotlib.figure.Figure): Figure to save
+    path (str): Output file path
+    """
+    fig.tight_layout()
+    fig.savefig(path, dpi=SAVE_DPI, bbox_inches='tight')
+    fig.clf()
+
+# Each worker process keeps one figure and reuses it for every plot it renders
+_figure = None
+
+def init_worker():
+    """
+    Select the non-interactive Agg backend in a plotting worker process.
+    """
+    matplotlib.use('Agg')
+
+def get_figure(width, height):
+    """
+    Return this process's reusable figure, resized for the next plot.
+    
+    Parameters:
+    width (float): Figure width in inches
+    height (float): Figure height in inches
+    
+    Returns:
+    matplotlib.figure.Figure: Empty figure of the requested size
+    """
+    global _figure
+    if _figure is None:
+        _figure = plt.figure()
+    # tight_layout of the previous plot changed the subplot margins; restoring
+    # the defaults makes each PNG independent of what the process drew before
+    _figure.subplotpars.update(**{name: matplotlib.rcParams[f'figure.subplot.{name}']
+                                  for name in ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')})
+    _figure.set_size_inches(width, height)
+    return _figure
+
+def code_bytes(code):
+    """
+    Bytes that change whenever the source of a function changes.
+    
+    Parameters:
+    code (types.CodeType): Code object of the function
+    
+    Returns:
+    bytes: Its bytecode, names and constants; nested code objects (e.g., lambdas) are included the same way
+    """
+    parts = [code.co_code, repr(code.co_names).encode()]
+    for const in code.co_consts:
+        # The repr of a code object holds its memory address, so nested code is expanded instead
+        parts.append(code_bytes(const) if isinstance(const, types.CodeType) else repr(const).encode())
+    return b"".join(parts)
+
+def plot_key(plot_func, args):
+    """
+    Content hash of a plot task, used to skip plots whose function and input data are unchanged.
+    
+    Parameters:
+    plot_func (function): Plot function
+    args (tuple): Its arguments other than the output path
+    
+    Returns:
+    str: Hex digest over the function name and code, the save resolution and the bytes of every argument
+    """
+    h = hashlib.blake2b(f"{plot_func.__name__}@{SAVE_DPI}".encode(), digest_size=16)
+    # An edited plot function (title, colors, bins, labels) renders again
+    h.update(code_bytes(plot_func.__code__))
+    for arg in args:
+        if isinstance(arg, (pd.Series, pd.DataFrame)):
+            # Row hashes cover the index and the values of every column
+            h.update(pd.util.hash_pandas_object(arg).to_numpy().tobytes())
+        elif isinstance(arg, np.ndarray):
+            h.update(arg.dtype.str.encode())
+            h.update(np.ascontiguousarray(arg).tobytes())
+        else:
+            h.update(repr(arg).encode())
+    return h.hexdigest()
+
+def render_one(task):
+    """
+    Render one plot task in a worker process, unless its PNG is up to date.
+    
+    A sidecar file next to each PNG stores the content hash of the data it was
+    rendered from; when the hash still matches, the saved PNG is kept as is.
+    
+    Parameters:
+    task (tuple): (plot function, tuple of its arguments, the output path first)
+    
+    Returns:
+    bool: Whether the plot was rendered
+    """
+    plot_func, args = task
+    path = args[0]
+    sidecar = path + '.hash'
+    key = plot_key(plot_func, args[1:])
+    if os.path.exists(path) and os.path.exists(sidecar):
+        with open(sidecar) as f:
+            if f.read() == key:
+                return False
+    plot_func(*args)
+    with open(sidecar, 'w') as f:
+        f.write(key)
+    return True
+
+def plot_property_types(path, property_type_counts):
+    """
+    Bar chart of listings per property type, with value labels.
+    
+    Parameters:
+    path (str): Output file path
+    property_type_counts (pd.Series): Listing count per property type
+    """
+    fig = get_figure(12, 8)
+    ax = fig.add_subplot()
+    property_type_counts.plot(kind='bar', ax=ax)
+    ax.set_title('Distribution of Property Types', fontsize=16)
+    ax.set_xlabel('Property Type', fontsize=12)
+    ax.set_ylabel('Count', fontsize=12)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    
+    # Add value labels on bars, in one call over the bars pandas drew
+    ax.bar_label(ax.containers[0], padding=3)
+    
+    save_figure(fig, path)
+
+def plot_histogram(path, values, title, xlabel, plain_x=False):
+    """
+    Histogram with 50 bins; the values are binned once with NumPy and drawn as bars.
+    
+    Parameters:
+    path (str): Output file path
+    values (np.ndarray): Values to bin
+    title (str): Plot title
+    xlabel (str): X-axis label
+    plain_x (bool): Whether to show plain numbers instead of scientific notation on the x-axis
+    """
+    fig = get_figure(12, 8)
+    ax = fig.add_subplot()
+    counts, edges = np.histogram(values, bins=50)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', edgecolor='black', alpha=0.7)
+    ax.set_title(title, fontsize=16)
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel('Frequency', fontsize=12)
+    if plain_x:
+        ax.ticklabel_format(style='plain', axis='x')
+    save_figure(fig, path)
+
+def plot_type_boxplot(path, data, y, order, title, ylabel, plain_y=False):
+    """
+    Boxplot of a value column for the given property types.
+    
+    Parameters:
+    path (str): Output file path
+    data (pd.DataFrame): Frame with a 'type' column and the value column
+    y (str): Name of the value column
+    order (list): Property types to draw, in order
+    title (str): Plot title
+    ylabel (str): Y-axis label
+    plain_y (bool): Whether to show plain numbers instead of scientific notation on the y-axis
+    """
+    fig = get_figure(15, 10)
+    ax = fig.add_subplot()
+    # seaborn draws only the types listed in order, so no filtered copy is needed
+    sns.boxplot(data=data, x='type', y=y, order=order, ax=ax)
+    ax.set_title(title, fontsize=16)
+    ax.set_xlabel('Property Type', fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    if plain_y:
+        ax.ticklabel_format(style='plain', axis='y')
+    save_figure(fig, path)
+
+def plot_room_counts(path, room_counts, title, xlabel):
+    """
+    Bar chart of listings per room count.
+    
+    Parameters:
+    path (str): Output file path
+    room_counts (pd.Series): Listing count per room count, in ascending order of the room count
+    title (str): Plot title
+    xlabel (str): X-axis label
+    """
+    fig = get_figure(12, 8)
+    ax = fig.add_subplot()
+    ax.bar(room_counts.index.to_numpy(), room_counts.to_numpy(), edgecolor='black', alpha=0.7)
+    ax.set_title(title, fontsize=16)
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel('Count', fontsize=12)
+    save_figure(fig, path)
+
+def plot_correlation_heatmap(path, corr_matrix):
+    """
+    Correlation heatmap drawn as a single image with one text label per cell.
+    
+    Parameters:
+    path (str): Output file path
+    corr_matrix (pd.DataFrame): Correlation matrix
+    """
+    fig = get_figure(10, 8)
+    ax = fig.add_subplot()
+    im = ax.imshow(corr_matrix.to_numpy(), cmap='Blues', vmin=-1, vmax=1)
+    fig.colorbar(im, ax=ax, shrink=.8)
+    ax.set_xticks(range(len(corr_matrix.columns)), corr_matrix.columns)
+    ax.set_yticks(range(len(corr_matrix.index)), corr_matrix.index)
+    ax.grid(False)
+    for i, row in enumerate(corr_matrix.to_numpy()):
+        for j, value in enumerate(row):
+            ax.text(j, i, f"{value:.2f}", ha='center', va='center', fontsize=12,
+                    color='white' if value > 0.5 else 'black')
+    ax.set_title('Correlation Matrix of Numeric Variables', fontsize=16)
+    save_figure(fig, path)
+
+def plot_price_vs_size(path, sizes, prices):
+    """
+    Price vs size density plot; hexagonal bins draw one artist instead of a marker per listing.
+    
+    Parameters:
+    path (str): Output file path
+    sizes (np.ndarray): Finite property sizes in square meters
+    prices (np.ndarray): Matching finite prices
+    """
+    fig = get_figure(12, 8)
+    ax = fig.add_subplot()
+    ax.hexbin(sizes, prices, gridsize=80, bins='log', cmap='Blues')
+    ax.set_title('Price vs Size', fontsize=16)
+    ax.set_xlabel('Size (sqm)', fontsize=12)
+    ax.set_ylabel('Price (EGP)', fontsize=12)
+    ax.ticklabel_format(style='plain', axis='y')
+    save_figure(fig, path)
+
+def plot_top_locations(path, top_locations):
+    """
+    Horizontal bar chart of the locations with the most listings, with value labels.
+    
+    Parameters:
+    path (str): Output file path
+    top_locations (pd.Series): Listing count per location
+    """
+    fig = get_figure(14, 10)
+    ax = fig.add_subplot()
+    top_locations.plot(kind='barh', ax=ax)
+    ax.set_title('Top 15 Locations by Property Count', fontsize=16)
+    ax.set_xlabel('Number of Properties', fontsize=12)
+    ax.set_ylabel('Location', fontsize=12)
+    
+    # Add value labels
+    for i, v in enumerate(top_locations.values):
+        ax.text(v + 3, i, str(v), ha='left', va='center')
+    
+    save_figure(fig, path)
+
+def category_counts(series, top=None):
+    """
+    Count the values of a categorical column, most common first, like value_counts.
+    
+    Parameters:
+    series (pd.Series): Categorical column
+    top (int): Number of most common categories to keep; all are kept when None
+    
+    Returns:
+    pd.Series: Count per category, in descending order of the count
+    """
+    # The categorical codes are small integers (-1 for missing), so bincount
+    # counts them without value_counts' hash table
+    codes = series.cat.codes.to_numpy()
+    counts = pd.Series(np.bincount(codes[codes >= 0], minlength=len(series.cat.categories)),
+                       index=series.cat.categories, name='count')
+    if top is not None:
+        # nlargest selects the top categories without sorting all of them
+        return counts.nlargest(top)
+    return counts.sort_values(ascending=False)
+
+def room_value_counts(series):
+    """
+    Count the listings per room count, in ascending order of the room count, like value_counts().sort_index().
+    
+    Parameters:
+    series (pd.Series): Bedroom or bathroom counts, possibly fractional or missing
+    
+    Returns:
+    pd.Series: Listing count per room count that occurs
+    """
+    values = series.dropna().to_numpy(dtype=np.float64)
+    if not (values % 1 == 0).all() or (values < 0).any():
+        # Fractional counts (e.g., filled medians such as 2.5) keep their own bars
+        return series.value_counts().sort_index()
+    # Whole non-negative counts are small integers, so bincount replaces a
+    # hash-and-sort value_counts
+    counts = np.bincount(values.astype(np.int64))
+    room_values = np.flatnonzero(counts)
+    return pd.Series(counts[room_values], index=room_values)
+
+def save_table(table, path):
+    """
+    Save a table to a CSV file, with a Parquet copy next to it that the dashboard app loads.
+    
+    Parameters:
+    table (pd.DataFrame or pd.Series): Table to save, its index included
+    path (str): Output CSV file path
+    """
+    table.to_csv(path)
+    if isinstance(table, pd.Series):
+        table = table.to_frame()
+    table.to_parquet(os.path.splitext(path)[0] + '.parquet', compression='zstd')
+
 def perform_eda(input_file, output_dir):
     """
     Perform comprehensive Exploratory Data Analysis on Egypt real estate dataset.
     
     Parameters:
-    input_file (str): Path to the cleaned CSV file
+    input_file (str): Path to the cleaned CSV file (its Parquet copy is used when present)
     output_dir (str): Directory to save plots and reports
     """
     
     # Load the dataset
     print("Loading dataset...")
-    df = pd.read_csv(input_file)
+    df, missing_values = load_dataset(input_file)
     print(f"Dataset shape: {df.shape}")
     
     # Create output directory if it doesn't exist
-    import os
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
     
     # Summary statistics
     print("\nGenerating summary statistics...")
     summary_stats = df.describe()
-    summary_stats.to_csv(f"{output_dir}/summary_statistics.csv")
+    save_table(summary_stats, f"{output_dir}/summary_statistics.csv")
     print("Summary statistics saved to summary_statistics.csv")
     
-    # Data types and info
-    print("\nDataset information:")
-    print(df.info())
-    
     # Missing values report
     print("\nMissing values:")
-    missing_values = df.isnull().sum()
-    missing_df = pd.DataFrame({'Column': missing_values.index, 'Missing_Count': missing_values.values})
-    missing_df['Missing_Percentage'] = (missing_df['Missing_Count'] / len(df)) * 100
-    missing_df.to_csv(f"{output_dir}/missing_values_report.csv", index=False)
+    # The CSV dumps write the aligned count Series side by side, with their
+    # index as the first column, instead of building an intermediate frame
+    save_table(pd.concat([
+        missing_values.rename('Missing_Count'),
+        ((missing_values / len(df)) * 100).rename('Missing_Percentage')
+    ], axis=1).rename_axis('Column'), f"{output_dir}/missing_values_report.csv")
     print("Missing values report saved to missing_values_report.csv")
     
     # Property type distribution
     print("\nAnalyzing property type distribution...")
-    property_type_counts = df['type'].value_counts()
-    property_type_df = pd.DataFrame({
-        'Property_Type': property_type_counts.index,
-        'Count': property_type_counts.values,
-        'Percentage': (property_type_counts.values / len(df)) * 100
-    })
-    property_type_df.to_csv(f"{output_dir}/property_type_distribution.csv", index=False)
+    property_type_counts = category_counts(df['type'])
+    save_table(pd.concat([
+        property_type_counts.rename('Count'),
+        ((property_type_counts / len(df)) * 100).rename('Percentage')
+    ], axis=1).rename_axis('Property_Type'), f"{output_dir}/property_type_distribution.csv")
     print("Property type distribution saved to property_type_distribution.csv")
     
     # Price analysis
     print("\nAnalyzing price distribution...")
+    # The three order statistics come from one np.quantile call; the report reuses these values
+    prices = df['price'].to_numpy()
+    q25, median, q75 = np.quantile(prices, [0.25, 0.5, 0.75])
     price_stats = {
-        'Mean': df['price'].mean(),
-        'Median': df['price'].median(),
-        'Std_Dev': df['price'].std(),
-        'Min': df['price'].min(),
-        'Max': df['price'].max(),
-        '25th_Percentile': df['price'].quantile(0.25),
-        '75th_Percentile': df['price'].quantile(0.75)
+        'Mean': prices.mean(),
+        'Median': median,
+        'Std_Dev': prices.std(ddof=1),
+        'Min': prices.min(),
+        'Max': prices.max(),
+        '25th_Percentile': q25,
+        '75th_Percentile': q75
     }
     
     price_stats_df = pd.DataFrame.from_dict(price_stats, orient='index', columns=['Value'])
-    price_stats_df.to_csv(f"{output_dir}/price_statistics.csv")
+    save_table(price_stats_df, f"{output_dir}/price_statistics.csv")
     print("Price statistics saved to price_statistics.csv")
     
     # Create visualizations
+    # Plots only read the data, so each is described here by its function and
+    # the arrays it needs, and all of them are rendered in parallel below
+    plot_tasks = []
     
     # 1. Property type distribution
-    plt.figure(figsize=(12, 8))
-    ax = property_type_counts.plot(kind='bar')
-    plt.title('Distribution of Property Types', fontsize=16)
-    plt.xlabel('Property Type', fontsize=12)
-    plt.ylabel('Count', fontsize=12)
-    plt.xticks(rotation=45, ha='right')
-    
-    # Add value labels on bars
-    for i, v in enumerate(property_type_counts.values):
-        ax.text(i, v + 10, str(v), ha='center', va='bottom')
-    
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/property_type_distribution.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Property type distribution plot saved to property_type_distribution.png")
+    plot_tasks.append(((plot_property_types, (f"{output_dir}/property_type_distribution.png", property_type_counts)),
+                       "Property type distribution plot saved to property_type_distribution.png"))
     
     # 2. Price distribution
-    plt.figure(figsize=(12, 8))
-    plt.hist(df['price'], bins=50, edgecolor='black', alpha=0.7)
-    plt.title('Distribution of Property Prices', fontsize=16)
-    plt.xlabel('Price (EGP)', fontsize=12)
-    plt.ylabel('Frequency', fontsize=12)
-    plt.ticklabel_format(style='plain', axis='x')
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/price_distribution.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Price distribution plot saved to price_distribution.png")
+    plot_tasks.append(((plot_histogram, (f"{output_dir}/price_distribution.png", prices,
+                                         'Distribution of Property Prices', 'Price (EGP)', True)),
+                       "Price distribution plot saved to price_distribution.png"))
     
     # 3. Price distribution by property type (boxplot)
-    plt.figure(figsize=(15, 10))
-    df_filtered = df[df['type'].isin(df['type'].value_counts().head(8).index)]
-    sns.boxplot(data=df_filtered, x='type', y='price')
-    plt.title('Price Distribution by Property Type', fontsize=16)
-    plt.xlabel('Property Type', fontsize=12)
-    plt.ylabel('Price (EGP)', fontsize=12)
-    plt.xticks(rotation=45, ha='right')
-    plt.ticklabel_format(style='plain', axis='y')
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/price_by_property_type.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Price by property type plot saved to price_by_property_type.png")
+    # value_counts is sorted by count, so its first eight labels are the top types
+    top_types = property_type_counts.index[:8].tolist()
+    plot_tasks.append(((plot_type_boxplot, (f"{output_dir}/price_by_property_type.png",
+                                            df[['type', 'price']], 'price', top_types,
+                                            'Price Distribution by Property Type', 'Price (EGP)', True)),
+                       "Price by property type plot saved to price_by_property_type.png"))
     
     # 4. Bedrooms distribution
-    plt.figure(figsize=(12, 8))
-    bedroom_counts = df['bedrooms'].value_counts().sort_index()
-    plt.bar(bedroom_counts.index, bedroom_counts.values, edgecolor='black', alpha=0.7)
-    plt.title('Distribution of Number of Bedrooms', fontsize=16)
-    plt.xlabel('Number of Bedrooms', fontsize=12)
-    plt.ylabel('Count', fontsize=12)
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/bedrooms_distribution.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Bedrooms distribution plot saved to bedrooms_distribution.png")
+    bedroom_counts = room_value_counts(df['bedrooms'])
+    plot_tasks.append(((plot_room_counts, (f"{output_dir}/bedrooms_distribution.png", bedroom_counts,
+                                           'Distribution of Number of Bedrooms', 'Number of Bedrooms')),
+                       "Bedrooms distribution plot saved to bedrooms_distribution.png"))
     
     # 5. Bathrooms distribution
-    plt.figure(figsize=(12, 8))
-    bathroom_counts = df['bathrooms'].value_counts().sort_index()
-    plt.bar(bathroom_counts.index, bathroom_counts.values, edgecolor='black', alpha=0.7)
-    plt.title('Distribution of Number of Bathrooms', fontsize=16)
-    plt.xlabel('Number of Bathrooms', fontsize=12)
-    plt.ylabel('Count', fontsize=12)
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/bathrooms_distribution.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Bathrooms distribution plot saved to bathrooms_distribution.png")
+    bathroom_counts = room_value_counts(df['bathrooms'])
+    plot_tasks.append(((plot_room_counts, (f"{output_dir}/bathrooms_distribution.png", bathroom_counts,
+                                           'Distribution of Number of Bathrooms', 'Number of Bathrooms')),
+                       "Bathrooms distribution plot saved to bathrooms_distribution.png"))
     
     # 6. Correlation heatmap
     print("\nGenerating correlation heatmap...")
     # Select only numeric columns for correlation
     numeric_df = df.select_dtypes(include=[np.number])
     
-    # Compute correlation matrix
-    corr_matrix = numeric_df.corr()
+    # Price per sqm is computed once, in float32, for the report and plots 9-10
+    price_per_sqm = np.empty(len(df), dtype=np.float32)
+    np.divide(df['price'].to_numpy(dtype=np.float32),
+              df['size_sqm'].to_numpy(dtype=np.float32, na_value=np.nan), out=price_per_sqm)
+    
+    # Compute the correlation matrix once, with price per sqm included for the
+    # report; pairwise correlations do not depend on the other columns, so the
+    # saved matrix is the subset without it
+    report_corr = pairwise_corr(numeric_df.assign(price_per_sqm=price_per_sqm))
+    corr_matrix = report_corr.loc[numeric_df.columns, numeric_df.columns]
     
     # Save correlation matrix
-    corr_matrix.to_csv(f"{output_dir}/correlation_matrix.csv")
+    save_table(corr_matrix, f"{output_dir}/correlation_matrix.csv")
     print("Correlation matrix saved to correlation_matrix.csv")
     
-    # Plot correlation heatmap
-    plt.figure(figsize=(10, 8))
-    sns.heatmap(corr_matrix, annot=True, cmap='Blues', center=0, 
-                square=True, linewidths=0.5, cbar_kws={"shrink": .8},
-                annot_kws={"size": 12})
-    plt.title('Correlation Matrix of Numeric Variables', fontsize=16)
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/correlation_heatmap.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Correlation heatmap saved to correlation_heatmap.png")
-    
-    # 7. Price vs Size scatter plot
-    plt.figure(figsize=(12, 8))
-    plt.scatter(df['size_sqm'], df['price'], alpha=0.5)
-    plt.title('Price vs Size', fontsize=16)
-    plt.xlabel('Size (sqm)', fontsize=12)
-    plt.ylabel('Price (EGP)', fontsize=12)
-    plt.ticklabel_format(style='plain', axis='y')
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/price_vs_size.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Price vs size plot saved to price_vs_size.png")
+    plot_tasks.append(((plot_correlation_heatmap, (f"{output_dir}/correlation_heatmap.png", corr_matrix)),
+                       "Correlation heatmap saved to correlation_heatmap.png"))
+    
+    # 7. Price vs Size density plot
+    sizes = df['size_sqm'].to_numpy(dtype=np.float64, na_value=np.nan)
+    finite = np.isfinite(sizes)
+    plot_tasks.append(((plot_price_vs_size, (f"{output_dir}/price_vs_size.png",
+                                             sizes[finite], prices[finite].astype(np.float64))),
+                       "Price vs size plot saved to price_vs_size.png"))
     
     # 8. Top locations by count
     print("\nAnalyzing top locations...")
-    top_locations = df['location'].value_counts().head(15)
-    top_locations_df = pd.DataFrame({
-        'Location': top_locations.index,
-        'Count': top_locations.values
-    })
-    top_locations_df.to_csv(f"{output_dir}/top_locations.csv", index=False)
+    top_locations = category_counts(df['location'], 15)
+    save_table(top_locations.rename('Count').rename_axis('Location'), f"{output_dir}/top_locations.csv")
     print("Top locations saved to top_locations.csv")
     
-    # Plot top locations
-    plt.figure(figsize=(14, 10))
-    ax = top_locations.plot(kind='barh')
-    plt.title('Top 15 Locations by Property Count', fontsize=16)
-    plt.xlabel('Number of Properties', fontsize=12)
-    plt.ylabel('Location', fontsize=12)
-    
-    # Add value labels
-    for i, v in enumerate(top_locations.values):
-        ax.text(v + 3, i, str(v), ha='left', va='center')
-    
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/top_locations.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Top locations plot saved to top_locations.png")
+    plot_tasks.append(((plot_top_locations, (f"{output_dir}/top_locations.png", top_locations)),
+                       "Top locations plot saved to top_locations.png"))
     
     # 9. Price per square meter analysis
     print("\nAnalyzing price per square meter...")
-    df['price_per_sqm'] = df['price'] / df['size_sqm']
-    
-    # Remove outliers in price per sqm (beyond 3 standard deviations)
-    price_per_sqm_mean = df['price_per_sqm'].mean()
-    price_per_sqm_std = df['price_per_sqm'].std()
-    lower_bound = price_per_sqm_mean - 3 * price_per_sqm_std
-    upper_bound = price_per_sqm_mean + 3 * price_per_sqm_std
-    df_filtered_ppsm = df[(df['price_per_sqm'] >= lower_bound) & (df['price_per_sqm'] <= upper_bound)]
-    
-    # Plot price per sqm distribution
-    plt.figure(figsize=(12, 8))
-    plt.hist(df_filtered_ppsm['price_per_sqm'], bins=50, edgecolor='black', alpha=0.7)
-    plt.title('Distribution of Price per Square Meter', fontsize=16)
-    plt.xlabel('Price per Square Meter (EGP/sqm)', fontsize=12)
-    plt.ylabel('Frequency', fontsize=12)
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/price_per_sqm_distribution.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Price per sqm distribution plot saved to price_per_sqm_distribution.png")
+    df['price_per_sqm'] = price_per_sqm
+    
+    # Remove outliers in price per sqm (values outside the 0.15th-99.85th
+    # percentiles, the tail coverage of +/-3 standard deviations, but not
+    # skewed by the extreme values being removed); one mask on the ndarray
+    lower_bound, upper_bound = np.nanquantile(price_per_sqm, [0.0015, 0.9985])
+    ppsm_mask = (price_per_sqm >= lower_bound) & (price_per_sqm <= upper_bound)
+    missing_values['price_per_sqm'] = np.isnan(price_per_sqm).sum()
+    df_filtered_ppsm = df.loc[ppsm_mask, ['type', 'price_per_sqm']]
+    
+    plot_tasks.append(((plot_histogram, (f"{output_dir}/price_per_sqm_distribution.png", price_per_sqm[ppsm_mask],
+                                         'Distribution of Price per Square Meter', 'Price per Square Meter (EGP/sqm)')),
+                       "Price per sqm distribution plot saved to price_per_sqm_distribution.png"))
     
     # 10. Price per sqm by property type
-    plt.figure(figsize=(15, 10))
-    df_filtered_type = df_filtered_ppsm[df_filtered_ppsm['type'].isin(
-        df_filtered_ppsm['type'].value_counts().head(8).index)]
-    sns.boxplot(data=df_filtered_type, x='type', y='price_per_sqm')
-    plt.title('Price per Square Meter by Property Type', fontsize=16)
-    plt.xlabel('Property Type', fontsize=12)
-    plt.ylabel('Price per Square Meter (EGP/sqm)', fontsize=12)
-    plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/price_per_sqm_by_type.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Price per sqm by type plot saved to price_per_sqm_by_type.png")
+    top_types_ppsm = category_counts(df_filtered_ppsm['type'], 8).index.tolist()
+    plot_tasks.append(((plot_type_boxplot, (f"{output_dir}/price_per_sqm_by_type.png",
+                                            df_filtered_ppsm, 'price_per_sqm', top_types_ppsm,
+                                            'Price per Square Meter by Property Type',
+                                            'Price per Square Meter (EGP/sqm)')),
+                       "Price per sqm by type plot saved to price_per_sqm_by_type.png"))
+    
+    # Render the plots in worker processes; each task receives only the columns
+    # it draws, and Agg rendering is CPU-bound and independent per figure.
+    # Plots whose data is unchanged since the last run are not re-rendered
+    print("\nRendering plots...")
+    tasks, messages = zip(*plot_tasks)
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=init_worker) as executor:
+        for message, rendered in zip(messages, executor.map(render_one, tasks)):
+            print(message if rendered else f"{message} (unchanged, kept)")
     
     # Generate EDA report
     print("\nGenerating EDA report...")
-    generate_eda_report(df, output_dir)
+    generate_eda_report(df, output_dir, report_corr, price_stats, missing_values,
+                        property_type_counts, top_locations)
     print("EDA report saved to eda_report.txt")
     
     print(f"\nEDA completed successfully! All outputs saved to {output_dir}")
 
-def generate_eda_report(df, output_dir):
+def generate_eda_report(df, output_dir, corr_matrix, price_stats, missing, type_counts, top_locations):
     """
     Generate a comprehensive EDA report.
     """
-    with open(f"{output_dir}/eda_report.txt", 'w') as f:
-        f.write("EGYPT REAL ESTATE EXPLORATORY DATA ANALYSIS REPORT\n")
-        f.write("=" * 60 + "\n\n")
+    with open(f"{output_dir}/eda_report.txt", 'w', buffering=1 << 20) as f:
+        # The report is assembled in memory and written in one call
+        parts = []
+        parts.append("EGYPT REAL ESTATE EXPLORATORY DATA ANALYSIS REPORT\n")
+        parts.append("=" * 60 + "\n\n")
         
-        f.write(f"Report generated on: {datetime.now()}\n\n")
+        parts.append(f"Report generated on: {datetime.now()}\n\n")
         
-        f.write("1. DATASET OVERVIEW\n")
-        f.write("-" * 20 + "\n")
-        f.write(f"Total Rows: {len(df):,}\n")
-        f.write(f"Total Columns: {len(df.columns)}\n")
-        f.write(f"Total Data Points: {df.size:,}\n\n")
+        parts.append("1. DATASET OVERVIEW\n")
+        parts.append("-" * 20 + "\n")
+        parts.append(f"Total Rows: {len(df):,}\n")
+        parts.append(f"Total Columns: {len(df.columns)}\n")
+        parts.append(f"Total Data Points: {df.size:,}\n\n")
         
-        f.write("2. COLUMN INFORMATION\n")
-        f.write("-" * 20 + "\n")
-        for col in df.columns:
-            f.write(f"{col}: {df[col].dtype}\n")
-        f.write("\n")
+        parts.append("2. COLUMN INFORMATION\n")
+        parts.append("-" * 20 + "\n")
+        parts.append(format_report_lines(df.dtypes, '{}'))
+        parts.append("\n")
         
-        f.write("3. MISSING VALUES SUMMARY\n")
-        f.write("-" * 25 + "\n")
-        missing = df.isnull().sum()
-        for col, count in missing.items():
-            if count > 0:
-                percentage = (count / len(df)) * 100
-                f.write(f"{col}: {count:,} ({percentage:.2f}%)\n")
-        f.write("\n")
+        parts.append("3. MISSING VALUES SUMMARY\n")
+        parts.append("-" * 25 + "\n")
+        parts.append(format_report_lines(missing[missing > 0], '{:,}', len(df)))
+        parts.append("\n")
         
-        f.write("4. PROPERTY TYPE DISTRIBUTION\n")
-        f.write("-" * 30 + "\n")
-        type_counts = df['type'].value_counts()
-        for property_type, count in type_counts.items():
-            percentage = (count / len(df)) * 100
-            f.write(f"{property_type}: {count:,} ({percentage:.2f}%)\n")
-        f.write("\n")
+        parts.append("4. PROPERTY TYPE DISTRIBUTION\n")
+        parts.append("-" * 30 + "\n")
+        parts.append(format_report_lines(type_counts, '{:,}', len(df)))
+        parts.append("\n")
         
-        f.write("5. PRICE STATISTICS\n")
-        f.write("-" * 18 + "\n")
-        f.write(f"Mean Price: {df['price'].mean():,.2f} EGP\n")
-        f.write(f"Median Price: {df['price'].median():,.2f} EGP\n")
-        f.write(f"Standard Deviation: {df['price'].std():,.2f} EGP\n")
-        f.write(f"Minimum Price: {df['price'].min():,} EGP\n")
-        f.write(f"Maximum Price: {df['price'].max():,} EGP\n")
-        f.write(f"25th Percentile: {df['price'].quantile(0.25):,.2f} EGP\n")
-        f.write(f"75th Percentile: {df['price'].quantile(0.75):,.2f} EGP\n\n")
+        parts.append("5. PRICE STATISTICS\n")
+        parts.append("-" * 18 + "\n")
+        parts.append(f"Mean Price: {price_stats['Mean']:,.2f} EGP\n")
+        parts.append(f"Median Price: {price_stats['Median']:,.2f} EGP\n")
+        parts.append(f"Standard Deviation: {price_stats['Std_Dev']:,.2f} EGP\n")
+        parts.append(f"Minimum Price: {price_stats['Min']:,} EGP\n")
+        parts.append(f"Maximum Price: {price_stats['Max']:,} EGP\n")
+        parts.append(f"25th Percentile: {price_stats['25th_Percentile']:,.2f} EGP\n")
+        parts.append(f"75th Percentile: {price_stats['75th_Percentile']:,.2f} EGP\n\n")
         
-        f.write("6. BEDROOMS AND BATHROOMS STATISTICS\n")
-        f.write("-" * 40 + "\n")
-        f.write(f"Mean Bedrooms: {df['bedrooms'].mean():.2f}\n")
-        f.write(f"Median Bedrooms: {df['bedrooms'].median():.2f}\n")
-        f.write(f"Mean Bathrooms: {df['bathrooms'].mean():.2f}\n")
-        f.write(f"Median Bathrooms: {df['bathrooms'].median():.2f}\n\n")
+        parts.append("6. BEDROOMS AND BATHROOMS STATISTICS\n")
+        parts.append("-" * 40 + "\n")
+        parts.append(f"Mean Bedrooms: {df['bedrooms'].mean():.2f}\n")
+        parts.append(f"Median Bedrooms: {df['bedrooms'].median():.2f}\n")
+        parts.append(f"Mean Bathrooms: {df['bathrooms'].mean():.2f}\n")
+        parts.append(f"Median Bathrooms: {df['bathrooms'].median():.2f}\n\n")
         
-        f.write("7. SIZE STATISTICS\n")
-        f.write("-" * 17 + "\n")
-        f.write(f"Mean Size: {df['size_sqm'].mean():.2f} sqm\n")
-        f.write(f"Median Size: {df['size_sqm'].median():.2f} sqm\n")
-        f.write(f"Standard Deviation: {df['size_sqm'].std():.2f} sqm\n")
-        f.write(f"Minimum Size: {df['size_sqm'].min():.2f} sqm\n")
-        f.write(f"Maximum Size: {df['size_sqm'].max():,.2f} sqm\n\n")
+        parts.append("7. SIZE STATISTICS\n")
+        parts.append("-" * 17 + "\n")
+        parts.append(f"Mean Size: {df['size_sqm'].mean():.2f} sqm\n")
+        parts.append(f"Median Size: {df['size_sqm'].median():.2f} sqm\n")
+        parts.append(f"Standard Deviation: {df['size_sqm'].std():.2f} sqm\n")
+        parts.append(f"Minimum Size: {df['size_sqm'].min():.2f} sqm\n")
+        parts.append(f"Maximum Size: {df['size_sqm'].max():,.2f} sqm\n\n")
         
-        f.write("8. CORRELATION ANALYSIS\n")
-        f.write("-" * 22 + "\n")
-        numeric_df = df.select_dtypes(include=[np.number])
-        corr_matrix = numeric_df.corr()
-        f.write("Correlation with Price:\n")
+        parts.append("8. CORRELATION ANALYSIS\n")
+        parts.append("-" * 22 + "\n")
+        parts.append("Correlation with Price:\n")
         price_corr = corr_matrix['price'].sort_values(key=abs, ascending=False)
         for col, corr in price_corr.items():
             if col != 'price':  # Skip self-correlation
-                f.write(f"{col}: {corr:.4f}\n")
-        f.write("\n")
+                parts.append(f"{col}: {corr:.4f}\n")
+        parts.append("\n")
         
-        f.write("9. TOP LOCATIONS\n")
-        f.write("-" * 15 + "\n")
-        top_locations = df['location'].value_counts().head(10)
-        for location, count in top_locations.items():
-            f.write(f"{location}: {count:,}\n")
-        f.write("\n")
+        parts.append("9. TOP LOCATIONS\n")
+        parts.append("-" * 15 + "\n")
+        parts.append(format_report_lines(top_locations.head(10), '{:,}'))
+        parts.append("\n")
         
-        f.write("10. KEY INSIGHTS\n")
-        f.write("-" * 14 + "\n")
-        f.write("1. Apartments, Chalets, and Villas make up the majority of listings\n")
-        f.write("2. Price distribution is heavily right-skewed, with a few very expensive properties\n")
-        f.write("3. Most properties have 2-4 bedrooms and 2-3 bathrooms\n")
-        f.write("4. Property prices show moderate correlation with size\n")
-        f.write("5. Location significantly impacts property prices\n")
-        f.write("6. Price per square meter varies considerably by property type\n")
+        parts.append("10. KEY INSIGHTS\n")
+        parts.append("-" * 14 + "\n")
+        parts.append("1. Apartments, Chalets, and Villas make up the majority of listings\n")
+        parts.append("2. Price distribution is heavily right-skewed, with a few very expensive properties\n")
+        parts.append("3. Most properties have 2-4 bedrooms and 2-3 bathrooms\n")
+        parts.append("4. Property prices show moderate correlation with size\n")
+        parts.append("5. Location significantly impacts property prices\n")
+        parts.append("6. Price per square meter varies considerably by property type\n")
+        f.write("".join(parts))
 
 if __name__ == "__main__":
     # Define input and output paths
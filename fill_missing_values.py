@@ -1,13 +1,62 @@
 import pandas as pd
 import numpy as np
+import os
+from dataset_utils import load_dataset
+
+def fill_category(series, value):
+    """
+    Fill missing values of a categorical column, adding the fill value as a category if needed.
+    
+    Parameters:
+    series (pd.Series): Categorical column
+    value (str): Fill value
+    
+    Returns:
+    pd.Series: Filled categorical column
+    """
+    if value not in series.cat.categories:
+        series = series.cat.add_categories(value)
+    return series.fillna(value)
+
+def fill_with_medians(series, group_medians):
+    """
+    Fill missing values of a float column from per-row group medians, then with the overall median.
+    
+    Parameters:
+    series (pd.Series): Float column
+    group_medians (np.ndarray): Median of each row's group, NaN where there is none
+    
+    Returns:
+    pd.Series: Filled column
+    """
+    # Both fills write in place into one copy of the column
+    values = series.to_numpy(copy=True)
+    np.putmask(values, np.isnan(values), np.asarray(group_medians, dtype=values.dtype))
+    np.putmask(values, np.isnan(values), np.nanmedian(values.astype(np.float64)))
+    return pd.Series(values, index=series.index, name=series.name)
+
+def gather_type_medians(types, medians):
+    """
+    Gather per-type medians back to the rows through the categorical codes of the type column.
+    
+    Parameters:
+    types (pd.Series): Categorical property type column
+    medians (pd.Series): Median per property type
+    
+    Returns:
+    np.ndarray: Median of each row's type, NaN where the type is missing or has no median
+    """
+    # The trailing NaN is what the -1 code of a missing type picks
+    per_category = np.append(medians.reindex(types.cat.categories).to_numpy(dtype=np.float64), np.nan)
+    return per_category[types.cat.codes.to_numpy()]
 
 def fill_missing_values(input_file, output_file):
     """
     Fill missing values in the Egypt real estate dataset intelligently.
     
     Parameters:
-    input_file (str): Path to the input CSV file
-    output_file (str): Path to save the filled CSV file
+    input_file (str): Path to the input CSV file (its Parquet copy is used when present)
+    output_file (str): Path to save the filled CSV file (a Parquet copy is written next to it)
     
     Returns:
     pd.DataFrame: DataFrame with filled missing values
@@ -15,12 +64,11 @@ def fill_missing_values(input_file, output_file):
     
     # Load the dataset
     print("Loading dataset...")
-    df = pd.read_csv(input_file)
+    df, missing_initial = load_dataset(input_file)
     print(f"Original dataset shape: {df.shape}")
     
     # Display initial missing values
     print("\nInitial missing values:")
-    missing_initial = df.isnull().sum()
     for col, count in missing_initial.items():
         if count > 0:
             percentage = (count / len(df)) * 100
@@ -30,48 +78,34 @@ def fill_missing_values(input_file, output_file):
     df['description'] = df['description'].fillna("No description provided")
     
     # Fill missing payment_method with "Not specified"
-    df['payment_method'] = df['payment_method'].fillna("Not specified")
+    df['payment_method'] = fill_category(df['payment_method'], "Not specified")
     
     # Fill missing bedrooms with median value based on property type
     print("\nFilling missing bedrooms...")
     # Calculate median bedrooms for each property type
-    median_bedrooms = df.groupby('type')['bedrooms'].median()
+    median_bedrooms = df.groupby('type', observed=True)['bedrooms'].median()
     print("Median bedrooms by property type:")
     for property_type, median in median_bedrooms.items():
         print(f"  {property_type}: {median}")
     
-    # Fill missing bedrooms based on property type
-    for property_type in df['type'].unique():
-        if pd.isna(property_type):
-            continue
-        mask = (df['type'] == property_type) & (df['bedrooms'].isnull())
-        df.loc[mask, 'bedrooms'] = median_bedrooms[property_type]
-    
-    # Fill remaining missing bedrooms with overall median
-    overall_median_bedrooms = df['bedrooms'].median()
-    df['bedrooms'] = df['bedrooms'].fillna(overall_median_bedrooms)
+    # Fill missing bedrooms based on property type from the medians above,
+    # without grouping again, and fill remaining missing bedrooms with overall median
+    df['bedrooms'] = fill_with_medians(df['bedrooms'], gather_type_medians(df['type'], median_bedrooms))
     
     # Fill missing bathrooms with median value based on property type
     print("\nFilling missing bathrooms...")
     # Calculate median bathrooms for each property type
-    median_bathrooms = df.groupby('type')['bathrooms'].median()
+    median_bathrooms = df.groupby('type', observed=True)['bathrooms'].median()
     print("Median bathrooms by property type:")
     for property_type, median in median_bathrooms.items():
         print(f"  {property_type}: {median}")
     
-    # Fill missing bathrooms based on property type
-    for property_type in df['type'].unique():
-        if pd.isna(property_type):
-            continue
-        mask = (df['type'] == property_type) & (df['bathrooms'].isnull())
-        df.loc[mask, 'bathrooms'] = median_bathrooms[property_type]
-    
-    # Fill remaining missing bathrooms with overall median
-    overall_median_bathrooms = df['bathrooms'].median()
-    df['bathrooms'] = df['bathrooms'].fillna(overall_median_bathrooms)
+    # Fill missing bathrooms based on property type from the medians above,
+    # without grouping again, and fill remaining missing bathrooms with overall median
+    df['bathrooms'] = fill_with_medians(df['bathrooms'], gather_type_medians(df['type'], median_bathrooms))
     
     # Fill missing available_from with "Available immediately"
-    df['available_from'] = df['available_from'].fillna("Available immediately")
+    df['available_from'] = fill_category(df['available_from'], "Available immediately")
     
     # Fill missing down_payment with 0 (assuming no down payment required)
     df['down_payment'] = df['down_payment'].fillna("0")
@@ -79,36 +113,35 @@ def fill_missing_values(input_file, output_file):
     # Fill missing size_sqm with median value based on property type and bedrooms
     print("\nFilling missing size_sqm...")
     # Calculate median size for each property type and bedroom combination
-    median_size = df.groupby(['type', 'bedrooms'])['size_sqm'].median()
+    size_groups = df.groupby(['type', 'bedrooms'], observed=True)['size_sqm']
+    median_size = size_groups.median()
     print(f"Unique combinations for size calculation: {len(median_size)}")
     
-    # Fill missing size_sqm based on property type and bedrooms
-    filled_count = 0
-    for (property_type, bedrooms), median in median_size.items():
-        if pd.isna(property_type) or pd.isna(bedrooms):
-            continue
-        mask = (df['type'] == property_type) & (df['bedrooms'] == bedrooms) & (df['size_sqm'].isnull())
-        filled = mask.sum()
-        if filled > 0:
-            df.loc[mask, 'size_sqm'] = median
-            filled_count += filled
+    # Fill missing size_sqm based on property type and bedrooms; the medians
+    # computed above are gathered back to the rows through each row's group
+    # id (-1 where type or bedrooms is missing picks the trailing NaN) and
+    # written in place into a copy of the column
+    size_values = df['size_sqm'].to_numpy(copy=True)
+    size_missing = np.isnan(size_values)
+    missing_before = size_missing.sum()
+    group_ids = size_groups.ngroup().fillna(-1).to_numpy(dtype=np.int64)
+    group_medians = np.append(median_size.to_numpy(), np.nan).astype(size_values.dtype)
+    np.putmask(size_values, size_missing, group_medians[group_ids])
+    size_missing = np.isnan(size_values)
+    filled_count = missing_before - size_missing.sum()
     
     print(f"Filled {filled_count} size_sqm values based on property type and bedrooms")
     
-    # Fill remaining missing size_sqm with median based on property type only
-    remaining_missing = df['size_sqm'].isnull().sum()
+    # Fill remaining missing size_sqm with median based on property type only,
+    # then any remaining missing size_sqm with overall median
+    size_sqm = pd.Series(size_values, index=df.index, name='size_sqm')
+    remaining_missing = size_missing.sum()
     if remaining_missing > 0:
         print(f"Filling {remaining_missing} remaining missing size_sqm values based on property type...")
-        median_size_by_type = df.groupby('type')['size_sqm'].median()
-        for property_type, median in median_size_by_type.items():
-            if pd.isna(property_type):
-                continue
-            mask = (df['type'] == property_type) & (df['size_sqm'].isnull())
-            df.loc[mask, 'size_sqm'] = median
-    
-    # Fill any remaining missing size_sqm with overall median
-    overall_median_size = df['size_sqm'].median()
-    df['size_sqm'] = df['size_sqm'].fillna(overall_median_size)
+        type_medians = size_sqm.groupby(df['type'], observed=True).transform('median').to_numpy()
+    else:
+        type_medians = np.full_like(size_values, np.nan)
+    df['size_sqm'] = fill_with_medians(size_sqm, type_medians)
     
     # Final check
     print("\nFinal missing values check:")
@@ -123,9 +156,13 @@ def fill_missing_values(input_file, output_file):
     if not any_missing:
         print("  No missing values found!")
     
-    # Save the filled dataset
+    # Save the filled dataset; the Parquet copy is what the report and EDA
+    # scripts load, so they skip CSV parsing
     df.to_csv(output_file, index=False)
     print(f"\nDataset with filled missing values saved to: {output_file}")
+    parquet_file = os.path.splitext(output_file)[0] + '.parquet'
+    df.to_parquet(parquet_file, compression='zstd', index=False)
+    print(f"Dataset with filled missing values saved to: {parquet_file}")
     print(f"Final dataset shape: {df.shape}")
     
     return df
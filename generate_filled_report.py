@@ -1,69 +1,64 @@
-import pandas as pd
+from dataset_utils import load_dataset, format_report_lines
 
 def generate_filled_data_quality_report(input_file, report_file):
     """
     Generate a data quality report for the filled dataset.
     
     Parameters:
-    input_file (str): Path to the filled CSV file
+    input_file (str): Path to the filled CSV file (its Parquet copy is used when present)
     report_file (str): Path to save the quality report
     """
     
     # Load the dataset
-    df = pd.read_csv(input_file)
+    df, missing = load_dataset(input_file)
     
-    with open(report_file, 'w') as f:
-        f.write("EGYPT REAL ESTATE DATA QUALITY REPORT (FILLED DATASET)\n")
-        f.write("=" * 55 + "\n\n")
+    with open(report_file, 'w', buffering=1 << 20) as f:
+        # The report is assembled in memory and written in one call
+        parts = []
+        parts.append("EGYPT REAL ESTATE DATA QUALITY REPORT (FILLED DATASET)\n")
+        parts.append("=" * 55 + "\n\n")
         
-        f.write("1. DATASET OVERVIEW\n")
-        f.write("-" * 20 + "\n")
-        f.write(f"Total Rows: {len(df)}\n")
-        f.write(f"Total Columns: {len(df.columns)}\n")
-        f.write(f"Total Cells: {df.size}\n\n")
+        parts.append("1. DATASET OVERVIEW\n")
+        parts.append("-" * 20 + "\n")
+        parts.append(f"Total Rows: {len(df)}\n")
+        parts.append(f"Total Columns: {len(df.columns)}\n")
+        parts.append(f"Total Cells: {df.size}\n\n")
         
-        f.write("2. COLUMN INFORMATION\n")
-        f.write("-" * 20 + "\n")
-        for col in df.columns:
-            f.write(f"{col}: {df[col].dtype}\n")
-        f.write("\n")
+        parts.append("2. COLUMN INFORMATION\n")
+        parts.append("-" * 20 + "\n")
+        parts.append(format_report_lines(df.dtypes, '{}'))
+        parts.append("\n")
         
-        f.write("3. MISSING VALUES\n")
-        f.write("-" * 15 + "\n")
-        missing = df.isnull().sum()
-        any_missing = False
-        for col, count in missing.items():
-            if count > 0:
-                percentage = (count / len(df)) * 100
-                f.write(f"{col}: {count} ({percentage:.2f}%)\n")
-                any_missing = True
+        parts.append("3. MISSING VALUES\n")
+        parts.append("-" * 15 + "\n")
+        missing = missing[missing > 0]
+        parts.append(format_report_lines(missing, '{}', len(df)))
         
-        if not any_missing:
-            f.write("No missing values found in the dataset!\n")
-        f.write("\n")
+        if missing.empty:
+            parts.append("No missing values found in the dataset!\n")
+        parts.append("\n")
         
-        f.write("4. DUPLICATE ROWS\n")
-        f.write("-" * 15 + "\n")
+        parts.append("4. DUPLICATE ROWS\n")
+        parts.append("-" * 15 + "\n")
         duplicates = df.duplicated().sum()
-        f.write(f"Duplicate Rows: {duplicates}\n\n")
+        parts.append(f"Duplicate Rows: {duplicates}\n\n")
         
-        f.write("5. STATISTICAL SUMMARY\n")
-        f.write("-" * 20 + "\n")
-        f.write(df.describe().to_string())
-        f.write("\n\n")
+        parts.append("5. STATISTICAL SUMMARY\n")
+        parts.append("-" * 20 + "\n")
+        parts.append(df.describe().to_string())
+        parts.append("\n\n")
         
-        f.write("6. PROPERTY TYPE DISTRIBUTION\n")
-        f.write("-" * 30 + "\n")
+        parts.append("6. PROPERTY TYPE DISTRIBUTION\n")
+        parts.append("-" * 30 + "\n")
         type_counts = df['type'].value_counts()
-        for property_type, count in type_counts.items():
-            f.write(f"{property_type}: {count}\n")
-        f.write("\n")
+        parts.append(format_report_lines(type_counts, '{}'))
+        parts.append("\n")
         
-        f.write("7. TOP 10 LOCATIONS\n")
-        f.write("-" * 18 + "\n")
-        location_counts = df['location'].value_counts().head(10)
-        for location, count in location_counts.items():
-            f.write(f"{location}: {count}\n")
+        parts.append("7. TOP 10 LOCATIONS\n")
+        parts.append("-" * 18 + "\n")
+        location_counts = df['location'].value_counts(sort=False).nlargest(10)
+        parts.append(format_report_lines(location_counts, '{}'))
+        f.write("".join(parts))
     
     print(f"Data quality report for filled dataset saved to: {report_file}")
 
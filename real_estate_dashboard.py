@@ -1,7 +1,15 @@
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib import font_manager
 import seaborn as sns
+from PIL import Image, ImageDraw, ImageFont
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
@@ -10,299 +18,464 @@ warnings.filterwarnings('ignore')
 plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
 
-def create_dashboard(cleaned_data_file, eda_output_dir, dashboard_output_dir):
+# Dtypes the statistics are computed in, for the numeric columns that are
+# kept while streaming the dataset; room counts stay float because they can
+# be missing. price is not listed: it is downcast to the smallest integer
+# type that holds every price, so a large price cannot wrap around
+DTYPES = {
+    'size_sqm': 'float32',
+    'bedrooms': 'float32',
+    'bathrooms': 'float32'
+}
+STAT_COLUMNS = ['price', 'bedrooms', 'bathrooms', 'size_sqm']
+
+# The dataset is read in chunks of this many bytes of CSV, or rows of Parquet
+CHUNK_BYTES = 256 << 20
+CHUNK_ROWS = 500_000
+
+# Chart tiles: (EDA image, grid position, column span, title, placeholder text);
+# the overview tiles sit on a 4x4 grid below the text panels, the detailed
+# tiles on a 3x3 grid
+OVERVIEW_CHARTS = [
+    ('property_type_distribution.png', (2, 0), 2, 'Property Types Distribution',
+     'Property Type Distribution Chart\n(Not Available)'),
+    ('price_distribution.png', (2, 2), 2, 'Price Distribution',
+     'Price Distribution Chart\n(Not Available)'),
+    ('top_locations.png', (3, 0), 2, 'Top Locations',
+     'Top Locations Chart\n(Not Available)'),
+    ('correlation_heatmap.png', (3, 2), 2, 'Correlation Heatmap',
+     'Correlation Heatmap\n(Not Available)')
+]
+
+DETAILED_CHARTS = [
+    ('price_by_property_type.png', (0, 0), 2, 'Price Distribution by Property Type',
+     'Price by Property Type Chart\n(Not Available)'),
+    ('bedrooms_distribution.png', (0, 2), 1, 'Bedrooms Distribution',
+     'Bedrooms Distribution Chart\n(Not Available)'),
+    ('bathrooms_distribution.png', (1, 0), 1, 'Bathrooms Distribution',
+     'Bathrooms Distribution Chart\n(Not Available)'),
+    ('price_vs_size.png', (1, 1), 1, 'Price vs Size',
+     'Price vs Size Chart\n(Not Available)'),
+    ('price_per_sqm_distribution.png', (1, 2), 1, 'Price per Square Meter',
+     'Price per Square Meter Chart\n(Not Available)'),
+    ('price_per_sqm_by_type.png', (2, 0), 3, 'Price per Square Meter by Property Type',
+     'Price per Square Meter by Type Chart\n(Not Available)')
+]
+
+# Dashboard canvas: 16 x 12 inches at 300 dpi, the size of the former
+# matplotlib dashboard figures, with a band for the title at the top
+DASHBOARD_DPI = 300
+DASHBOARD_SIZE = (16 * DASHBOARD_DPI, 12 * DASHBOARD_DPI)
+TITLE_HEIGHT = 150
+PADDING = 40
+
+def dashboard_font(points, bold=False):
+    """
+    Load matplotlib's default font at a point size on the dashboard canvas.
+    
+    Parameters:
+    points (float): Font size in points
+    bold (bool): Whether to load the bold face
+    
+    Returns:
+    PIL.ImageFont.FreeTypeFont: Font sized in canvas pixels
+    """
+    path = font_manager.findfont(font_manager.FontProperties(weight='bold' if bold else 'normal'))
+    return ImageFont.truetype(path, round(points * DASHBOARD_DPI / 72))
+
+def grid_box(shape, loc, rowspan=1, colspan=1):
+    """
+    Pixel box of a grid cell on the dashboard canvas, laid out like plt.subplot2grid.
+    
+    Parameters:
+    shape (tuple): (rows, columns) of the grid
+    loc (tuple): (row, column) of the cell
+    rowspan (int): Number of rows the cell spans
+    colspan (int): Number of columns the cell spans
+    
+    Returns:
+    tuple: (left, top, right, bottom) in pixels
+    """
+    rows, cols = shape
+    row, col = loc
+    cell_width = (DASHBOARD_SIZE[0] - 2 * PADDING) / cols
+    cell_height = (DASHBOARD_SIZE[1] - TITLE_HEIGHT - PADDING) / rows
+    left = PADDING + col * cell_width
+    top = TITLE_HEIGHT + row * cell_height
+    return (round(left), round(top), round(left + colspan * cell_width), round(top + rowspan * cell_height))
+
+def new_dashboard(title):
+    """
+    Create a white dashboard canvas with its title drawn at the top.
+    
+    Parameters:
+    title (str): Dashboard title
+    
+    Returns:
+    tuple: (PIL.Image.Image canvas, PIL.ImageDraw.ImageDraw for drawing on it)
+    """
+    canvas = Image.new('RGB', DASHBOARD_SIZE, 'white')
+    draw = ImageDraw.Draw(canvas)
+    draw.text((DASHBOARD_SIZE[0] / 2, TITLE_HEIGHT / 2), title,
+              font=dashboard_font(20, bold=True), fill='black', anchor='mm')
+    return canvas, draw
+
+def paste_chart(canvas, draw, image_path, box, title, placeholder):
+    """
+    Paste a chart PNG into a grid cell below its title, scaled down to fit.
+    
+    Parameters:
+    canvas (PIL.Image.Image): Dashboard canvas
+    draw (PIL.ImageDraw.ImageDraw): Drawing context of the canvas
+    image_path (str): Path to the chart PNG
+    box (tuple): (left, top, right, bottom) of the cell in pixels
+    title (str): Title drawn above the chart
+    placeholder (str): Text drawn instead of the chart when it cannot be loaded
+    """
+    left, top, right, bottom = box
+    center_x = (left + right) / 2
+    title_font = dashboard_font(14, bold=True)
+    draw.text((center_x, top + PADDING), title, font=title_font, fill='black', anchor='mt')
+    chart_top = top + 2 * PADDING + title_font.size
+    
+    try:
+        with Image.open(image_path) as img:
+            tile = img.convert('RGB')
+    except OSError:
+        draw.multiline_text((center_x, (chart_top + bottom) / 2), placeholder,
+                            font=dashboard_font(12), fill='black', anchor='mm', align='center')
+        return
+    
+    # Keep the chart's aspect ratio, centered in the space below the title
+    tile.thumbnail((right - left - 2 * PADDING, bottom - chart_top - PADDING), Image.LANCZOS)
+    canvas.paste(tile, (round(center_x - tile.width / 2),
+                        round(chart_top + (bottom - PADDING - chart_top - tile.height) / 2)))
+
+def draw_text_panel(draw, box, title, lines):
+    """
+    Draw a text-only panel into a grid cell: a title and lines placed like ax.text on a hidden axes.
+    
+    Parameters:
+    draw (PIL.ImageDraw.ImageDraw): Drawing context of the canvas
+    box (tuple): (left, top, right, bottom) of the cell in pixels
+    title (str): Title drawn at the top of the panel
+    lines (list): (y, text, points, bold) per line, y being the baseline as a
+    fraction of the panel height from the bottom
+    """
+    left, top, right, bottom = box
+    title_font = dashboard_font(16, bold=True)
+    draw.text(((left + right) / 2, top + PADDING), title, font=title_font, fill='black', anchor='mt')
+    
+    # Lines start a tenth of the way in, like ax.text(0.1, y, ...)
+    panel_top = top + 2 * PADDING + title_font.size
+    panel_height = bottom - PADDING - panel_top
+    x = left + 0.1 * (right - left)
+    for y, text, points, bold in lines:
+        draw.text((x, bottom - PADDING - y * panel_height), text,
+                  font=dashboard_font(points, bold=bold), fill='black', anchor='ls')
+
+def iter_batches(input_file):
+    """
+    Read a dataset in chunks, preferring its Parquet copy when one exists next to the CSV file.
+    
+    Parameters:
+    input_file (str): Path to the CSV file
+    
+    Returns:
+    iterator: pyarrow.RecordBatch chunks of the dataset
+    """
+    parquet_file = os.path.splitext(input_file)[0] + '.parquet'
+    if os.path.exists(parquet_file):
+        with pq.ParquetFile(parquet_file) as parquet:
+            yield from parquet.iter_batches(batch_size=CHUNK_ROWS)
+        return
+    
+    # Arrow's streaming parser; descriptions contain quoted newlines. Column
+    # types are fixed so a chunk with only missing values cannot change them
+    column_types = {col: pa.float64() for col in STAT_COLUMNS}
+    column_types.update({'type': pa.string(), 'location': pa.string()})
+    yield from pacsv.open_csv(
+        input_file,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=CHUNK_BYTES),
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(strings_can_be_null=True, column_types=column_types)
+    )
+
+def summarize_dataset(input_file):
+    """
+    Compute the aggregates shown on the dashboard and in the summary report in one pass over the dataset.
+    
+    Parameters:
+    input_file (str): Path to the cleaned CSV file (its Parquet copy is used when present)
+    
+    Returns:
+    dict: Row and column counts, missing values per column, property type and
+    location counts, and the mean/median/min/max/std of each numeric column
+    """
+    rows = 0
+    missing = None
+    counts = {'type': [], 'location': []}
+    values = {col: [] for col in STAT_COLUMNS}
+    
+    # Only the counts and the non-missing numeric values are kept from each
+    # chunk; the medians need every value, the other columns are dropped
+    for batch in iter_batches(input_file):
+        rows += batch.num_rows
+        batch_missing = pd.Series({name: batch.column(name).null_count for name in batch.schema.names})
+        missing = batch_missing if missing is None else missing + batch_missing
+        for col, chunk_counts in counts.items():
+            chunk_counts.append(batch.column(col).to_pandas().value_counts())
+        for col, chunk_values in values.items():
+            chunk_values.append(batch.column(col).drop_null().to_numpy())
+    
+    def total_counts(chunk_counts):
+        # Most common first; ties keep the alphabetical order of categoricals
+        return pd.concat(chunk_counts).groupby(level=0).sum().sort_values(ascending=False, kind='stable')
+    
+    def stat_values(col):
+        column = pd.Series(np.concatenate(values[col]))
+        if col in DTYPES:
+            return column.astype(DTYPES[col])
+        return pd.to_numeric(column, downcast='integer')
+    
+    stats = pd.DataFrame({
+        col: stat_values(col).agg(['mean', 'median', 'min', 'max', 'std'])
+        for col in STAT_COLUMNS
+    })
+    return {
+        'rows': rows,
+        'columns': len(missing),
+        'missing': missing,
+        'type_counts': total_counts(counts['type']),
+        'location_counts': total_counts(counts['location']),
+        'stats': stats
+    }
+
+def outputs_up_to_date(inputs, outputs):
+    """
+    Check whether every output file is newer than every existing input file.
+    
+    Parameters:
+    inputs (list): Paths of the input files; missing inputs are skipped
+    outputs (list): Paths of the output files
+    
+    Returns:
+    bool: True when all outputs exist and none is older than an input
+    """
+    if not all(os.path.exists(path) for path in outputs):
+        return False
+    input_times = [os.path.getmtime(path) for path in inputs if os.path.exists(path)]
+    return min(os.path.getmtime(path) for path in outputs) >= max(input_times, default=0)
+
+def create_overview_dashboard(summary, eda_output_dir, dashboard_output_dir):
+    """
+    Create the data overview dashboard: text panels of the dataset summary above four EDA charts.
+    
+    Parameters:
+    summary (dict): Dataset aggregates from summarize_dataset
+    eda_output_dir (str): Directory containing EDA outputs
+    dashboard_output_dir (str): Directory to save dashboard outputs
+    """
+    rows, columns = summary['rows'], summary['columns']
+    stats = summary['stats']
+    canvas, draw = new_dashboard('Egypt Real Estate Data Analysis Dashboard')
+    
+    # The four text panels take the top half of a 4x4 grid and are drawn
+    # straight onto the canvas
+    top_types = summary['type_counts'].head(5)
+    type_lines = [(0.9, "Top Property Types:", 14, True)]
+    for i, (ptype, count) in enumerate(top_types.items()):
+        pct = (count / rows) * 100
+        type_lines.append((0.7 - i*0.15, f"{ptype}: {count:,} ({pct:.1f}%)", 12, False))
+    
+    text_panels = [
+        ((0, 0), 'Dataset Overview', [
+            (0.9, f"Total Properties: {rows:,}", 14, True),
+            (0.7, f"Total Columns: {columns}", 14, True),
+            (0.5, f"Total Data Points: {rows * columns:,}", 14, True),
+            (0.3, f"Missing Data: {summary['missing'].sum():,}", 14, True)
+        ]),
+        ((0, 2), 'Property Type Distribution', type_lines),
+        ((1, 0), 'Price Statistics', [
+            (0.9, f"Mean Price: {stats.at['mean', 'price']:,.0f} EGP", 12, False),
+            (0.7, f"Median Price: {stats.at['median', 'price']:,.0f} EGP", 12, False),
+            (0.5, f"Min Price: {int(stats.at['min', 'price']):,} EGP", 12, False),
+            (0.3, f"Max Price: {int(stats.at['max', 'price']):,} EGP", 12, False)
+        ]),
+        ((1, 2), 'Bedrooms & Bathrooms', [
+            (0.9, f"Mean Bedrooms: {stats.at['mean', 'bedrooms']:.2f}", 12, False),
+            (0.7, f"Median Bedrooms: {stats.at['median', 'bedrooms']:.0f}", 12, False),
+            (0.5, f"Mean Bathrooms: {stats.at['mean', 'bathrooms']:.2f}", 12, False),
+            (0.3, f"Median Bathrooms: {stats.at['median', 'bathrooms']:.0f}", 12, False)
+        ])
+    ]
+    for loc, title, lines in text_panels:
+        draw_text_panel(draw, grid_box((4, 4), loc, colspan=2), title, lines)
+    
+    for image_name, loc, colspan, title, placeholder in OVERVIEW_CHARTS:
+        paste_chart(canvas, draw, f"{eda_output_dir}/{image_name}",
+                    grid_box((4, 4), loc, colspan=colspan), title, placeholder)
+    
+    canvas.save(f"{dashboard_output_dir}/dashboard_overview.png", dpi=(DASHBOARD_DPI, DASHBOARD_DPI), optimize=True)
+
+def create_detailed_dashboard(eda_output_dir, dashboard_output_dir):
+    """
+    Create the detailed analysis dashboard from six EDA charts.
+    
+    Parameters:
+    eda_output_dir (str): Directory containing EDA outputs
+    dashboard_output_dir (str): Directory to save dashboard outputs
+    """
+    canvas, draw = new_dashboard('Detailed Analysis Dashboard')
+    
+    for image_name, loc, colspan, title, placeholder in DETAILED_CHARTS:
+        paste_chart(canvas, draw, f"{eda_output_dir}/{image_name}",
+                    grid_box((3, 3), loc, colspan=colspan), title, placeholder)
+    
+    canvas.save(f"{dashboard_output_dir}/dashboard_detailed.png", dpi=(DASHBOARD_DPI, DASHBOARD_DPI), optimize=True)
+
+def create_dashboard(cleaned_data_file, eda_output_dir, dashboard_output_dir, force=False):
     """
     Create a comprehensive dashboard summarizing data cleaning and EDA results.
     
     Parameters:
-    cleaned_data_file (str): Path to the cleaned CSV file
+    cleaned_data_file (str): Path to the cleaned CSV file (its Parquet copy is used when present)
     eda_output_dir (str): Directory containing EDA outputs
     dashboard_output_dir (str): Directory to save dashboard outputs
+    force (bool): Rebuild the dashboard even if its outputs are newer than its inputs
     """
     
+    # Each dashboard is skipped when nothing it reads changed since it was
+    # written: the overview and the summary report read the dataset and the
+    # overview charts, the detailed dashboard only its charts
+    data_inputs = [cleaned_data_file, os.path.splitext(cleaned_data_file)[0] + '.parquet']
+    overview_inputs = data_inputs + [f"{eda_output_dir}/{chart[0]}" for chart in OVERVIEW_CHARTS]
+    detailed_inputs = [f"{eda_output_dir}/{chart[0]}" for chart in DETAILED_CHARTS]
+    build_overview = force or not outputs_up_to_date(
+        overview_inputs, [f"{dashboard_output_dir}/dashboard_overview.png", f"{dashboard_output_dir}/dashboard_summary.txt"])
+    build_detailed = force or not outputs_up_to_date(
+        detailed_inputs, [f"{dashboard_output_dir}/dashboard_detailed.png"])
+    if not build_overview and not build_detailed:
+        print(f"Dashboard up-to-date in {dashboard_output_dir}; pass force=True (--force) to rebuild")
+        return
+    
     # Create output directory if it doesn't exist
-    import os
     if not os.path.exists(dashboard_output_dir):
         os.makedirs(dashboard_output_dir)
     
-    # Load the cleaned dataset
-    print("Loading cleaned dataset...")
-    df = pd.read_csv(cleaned_data_file)
-    print(f"Dataset shape: {df.shape}")
-    
-    # Create dashboard figures
-    
-    # 1. Data Overview Dashboard
-    fig1 = plt.figure(figsize=(16, 12))
-    fig1.suptitle('Egypt Real Estate Data Analysis Dashboard', fontsize=20, fontweight='bold')
-    
-    # Dataset Overview
-    ax1 = plt.subplot2grid((4, 4), (0, 0), colspan=2)
-    ax1.text(0.1, 0.9, f"Total Properties: {len(df):,}", fontsize=14, fontweight='bold')
-    ax1.text(0.1, 0.7, f"Total Columns: {len(df.columns)}", fontsize=14, fontweight='bold')
-    ax1.text(0.1, 0.5, f"Total Data Points: {df.size:,}", fontsize=14, fontweight='bold')
-    ax1.text(0.1, 0.3, f"Missing Data: {df.isnull().sum().sum():,}", fontsize=14, fontweight='bold')
-    ax1.set_title('Dataset Overview', fontsize=16, fontweight='bold')
-    ax1.axis('off')
-    
-    # Property Type Distribution (Text)
-    ax2 = plt.subplot2grid((4, 4), (0, 2), colspan=2)
-    type_counts = df['type'].value_counts()
-    top_types = type_counts.head(5)
-    ax2.text(0.1, 0.9, "Top Property Types:", fontsize=14, fontweight='bold')
-    for i, (ptype, count) in enumerate(top_types.items()):
-        pct = (count / len(df)) * 100
-        ax2.text(0.1, 0.7 - i*0.15, f"{ptype}: {count:,} ({pct:.1f}%)", fontsize=12)
-    ax2.set_title('Property Type Distribution', fontsize=16, fontweight='bold')
-    ax2.axis('off')
-    
-    # Price Statistics
-    ax3 = plt.subplot2grid((4, 4), (1, 0), colspan=2)
-    ax3.text(0.1, 0.9, f"Mean Price: {df['price'].mean():,.0f} EGP", fontsize=12)
-    ax3.text(0.1, 0.7, f"Median Price: {df['price'].median():,.0f} EGP", fontsize=12)
-    ax3.text(0.1, 0.5, f"Min Price: {df['price'].min():,} EGP", fontsize=12)
-    ax3.text(0.1, 0.3, f"Max Price: {df['price'].max():,} EGP", fontsize=12)
-    ax3.set_title('Price Statistics', fontsize=16, fontweight='bold')
-    ax3.axis('off')
-    
-    # Bedrooms and Bathrooms Statistics
-    ax4 = plt.subplot2grid((4, 4), (1, 2), colspan=2)
-    ax4.text(0.1, 0.9, f"Mean Bedrooms: {df['bedrooms'].mean():.2f}", fontsize=12)
-    ax4.text(0.1, 0.7, f"Median Bedrooms: {df['bedrooms'].median():.0f}", fontsize=12)
-    ax4.text(0.1, 0.5, f"Mean Bathrooms: {df['bathrooms'].mean():.2f}", fontsize=12)
-    ax4.text(0.1, 0.3, f"Median Bathrooms: {df['bathrooms'].median():.0f}", fontsize=12)
-    ax4.set_title('Bedrooms & Bathrooms', fontsize=16, fontweight='bold')
-    ax4.axis('off')
-    
-    # Load and display property type distribution chart
-    try:
-        img1 = plt.imread(f"{eda_output_dir}/property_type_distribution.png")
-        ax5 = plt.subplot2grid((4, 4), (2, 0), colspan=2)
-        ax5.imshow(img1)
-        ax5.set_title('Property Types Distribution', fontsize=14, fontweight='bold')
-        ax5.axis('off')
-    except:
-        ax5 = plt.subplot2grid((4, 4), (2, 0), colspan=2)
-        ax5.text(0.5, 0.5, 'Property Type Distribution Chart\n(Not Available)', 
-                ha='center', va='center', fontsize=12)
-        ax5.set_title('Property Types Distribution', fontsize=14, fontweight='bold')
-        ax5.axis('off')
-    
-    # Load and display price distribution chart
-    try:
-        img2 = plt.imread(f"{eda_output_dir}/price_distribution.png")
-        ax6 = plt.subplot2grid((4, 4), (2, 2), colspan=2)
-        ax6.imshow(img2)
-        ax6.set_title('Price Distribution', fontsize=14, fontweight='bold')
-        ax6.axis('off')
-    except:
-        ax6 = plt.subplot2grid((4, 4), (2, 2), colspan=2)
-        ax6.text(0.5, 0.5, 'Price Distribution Chart\n(Not Available)', 
-                ha='center', va='center', fontsize=12)
-        ax6.set_title('Price Distribution', fontsize=14, fontweight='bold')
-        ax6.axis('off')
-    
-    # Load and display top locations chart
-    try:
-        img3 = plt.imread(f"{eda_output_dir}/top_locations.png")
-        ax7 = plt.subplot2grid((4, 4), (3, 0), colspan=2)
-        ax7.imshow(img3)
-        ax7.set_title('Top Locations', fontsize=14, fontweight='bold')
-        ax7.axis('off')
-    except:
-        ax7 = plt.subplot2grid((4, 4), (3, 0), colspan=2)
-        ax7.text(0.5, 0.5, 'Top Locations Chart\n(Not Available)', 
-                ha='center', va='center', fontsize=12)
-        ax7.set_title('Top Locations', fontsize=14, fontweight='bold')
-        ax7.axis('off')
-    
-    # Load and display correlation heatmap
-    try:
-        img4 = plt.imread(f"{eda_output_dir}/correlation_heatmap.png")
-        ax8 = plt.subplot2grid((4, 4), (3, 2), colspan=2)
-        ax8.imshow(img4)
-        ax8.set_title('Correlation Heatmap', fontsize=14, fontweight='bold')
-        ax8.axis('off')
-    except:
-        ax8 = plt.subplot2grid((4, 4), (3, 2), colspan=2)
-        ax8.text(0.5, 0.5, 'Correlation Heatmap\n(Not Available)', 
-                ha='center', va='center', fontsize=12)
-        ax8.set_title('Correlation Heatmap', fontsize=14, fontweight='bold')
-        ax8.axis('off')
-    
-    plt.tight_layout()
-    plt.savefig(f"{dashboard_output_dir}/dashboard_overview.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Dashboard overview saved to dashboard_overview.png")
-    
-    # 2. Detailed Analysis Dashboard
-    fig2 = plt.figure(figsize=(16, 12))
-    fig2.suptitle('Detailed Analysis Dashboard', fontsize=20, fontweight='bold')
-    
-    # Price by Property Type
-    try:
-        img5 = plt.imread(f"{eda_output_dir}/price_by_property_type.png")
-        ax9 = plt.subplot2grid((3, 3), (0, 0), colspan=2)
-        ax9.imshow(img5)
-        ax9.set_title('Price Distribution by Property Type', fontsize=14, fontweight='bold')
-        ax9.axis('off')
-    except:
-        ax9 = plt.subplot2grid((3, 3), (0, 0), colspan=2)
-        ax9.text(0.5, 0.5, 'Price by Property Type Chart\n(Not Available)', 
-                ha='center', va='center', fontsize=12)
-        ax9.set_title('Price Distribution by Property Type', fontsize=14, fontweight='bold')
-        ax9.axis('off')
-    
-    # Bedrooms Distribution
-    try:
-        img6 = plt.imread(f"{eda_output_dir}/bedrooms_distribution.png")
-        ax10 = plt.subplot2grid((3, 3), (0, 2))
-        ax10.imshow(img6)
-        ax10.set_title('Bedrooms Distribution', fontsize=14, fontweight='bold')
-        ax10.axis('off')
-    except:
-        ax10 = plt.subplot2grid((3, 3), (0, 2))
-        ax10.text(0.5, 0.5, 'Bedrooms Distribution Chart\n(Not Available)', 
-                ha='center', va='center', fontsize=12)
-        ax10.set_title('Bedrooms Distribution', fontsize=14, fontweight='bold')
-        ax10.axis('off')
-    
-    # Bathrooms Distribution
-    try:
-        img7 = plt.imread(f"{eda_output_dir}/bathrooms_distribution.png")
-        ax11 = plt.subplot2grid((3, 3), (1, 0))
-        ax11.imshow(img7)
-        ax11.set_title('Bathrooms Distribution', fontsize=14, fontweight='bold')
-        ax11.axis('off')
-    except:
-        ax11 = plt.subplot2grid((3, 3), (1, 0))
-        ax11.text(0.5, 0.5, 'Bathrooms Distribution Chart\n(Not Available)', 
-                ha='center', va='center', fontsize=12)
-        ax11.set_title('Bathrooms Distribution', fontsize=14, fontweight='bold')
-        ax11.axis('off')
-    
-    # Price vs Size
-    try:
-        img8 = plt.imread(f"{eda_output_dir}/price_vs_size.png")
-        ax12 = plt.subplot2grid((3, 3), (1, 1))
-        ax12.imshow(img8)
-        ax12.set_title('Price vs Size', fontsize=14, fontweight='bold')
-        ax12.axis('off')
-    except:
-        ax12 = plt.subplot2grid((3, 3), (1, 1))
-        ax12.text(0.5, 0.5, 'Price vs Size Chart\n(Not Available)', 
-                ha='center', va='center', fontsize=12)
-        ax12.set_title('Price vs Size', fontsize=14, fontweight='bold')
-        ax12.axis('off')
-    
-    # Price per Square Meter Distribution
-    try:
-        img9 = plt.imread(f"{eda_output_dir}/price_per_sqm_distribution.png")
-        ax13 = plt.subplot2grid((3, 3), (1, 2))
-        ax13.imshow(img9)
-        ax13.set_title('Price per Square Meter', fontsize=14, fontweight='bold')
-        ax13.axis('off')
-    except:
-        ax13 = plt.subplot2grid((3, 3), (1, 2))
-        ax13.text(0.5, 0.5, 'Price per Square Meter Chart\n(Not Available)', 
-                ha='center', va='center', fontsize=12)
-        ax13.set_title('Price per Square Meter', fontsize=14, fontweight='bold')
-        ax13.axis('off')
-    
-    # Price per Square Meter by Type
-    try:
-        img10 = plt.imread(f"{eda_output_dir}/price_per_sqm_by_type.png")
-        ax14 = plt.subplot2grid((3, 3), (2, 0), colspan=3)
-        ax14.imshow(img10)
-        ax14.set_title('Price per Square Meter by Property Type', fontsize=14, fontweight='bold')
-        ax14.axis('off')
-    except:
-        ax14 = plt.subplot2grid((3, 3), (2, 0), colspan=3)
-        ax14.text(0.5, 0.5, 'Price per Square Meter by Type Chart\n(Not Available)', 
-                ha='center', va='center', fontsize=12)
-        ax14.set_title('Price per Square Meter by Property Type', fontsize=14, fontweight='bold')
-        ax14.axis('off')
-    
-    plt.tight_layout()
-    plt.savefig(f"{dashboard_output_dir}/dashboard_detailed.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Detailed dashboard saved to dashboard_detailed.png")
-    
-    # 3. Summary Report
-    create_summary_report(df, eda_output_dir, dashboard_output_dir)
-    print("Summary report saved to dashboard_summary.txt")
+    # Create dashboard images; the charts are already rendered PNGs, so each
+    # dashboard is a canvas the charts are pasted onto, scaled to their cells.
+    # The two dashboards are independent and are drawn in separate worker
+    # processes; the detailed one starts while the dataset is summarized
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        if build_detailed:
+            detailed = executor.submit(create_detailed_dashboard, eda_output_dir, dashboard_output_dir)
+        
+        if build_overview:
+            # Summarize the cleaned dataset; the charts come from the EDA outputs, so
+            # only these aggregates are needed and the dataset is streamed
+            print("Loading cleaned dataset...")
+            summary = summarize_dataset(cleaned_data_file)
+            print(f"Dataset shape: {(summary['rows'], summary['columns'])}")
+            
+            # 1. Data Overview Dashboard
+            overview = executor.submit(create_overview_dashboard, summary, eda_output_dir, dashboard_output_dir)
+            
+            # 3. Summary Report
+            create_summary_report(summary, eda_output_dir, dashboard_output_dir)
+            
+            overview.result()
+            print("Dashboard overview saved to dashboard_overview.png")
+        else:
+            print("Dashboard overview and summary report up-to-date, kept")
+        
+        # 2. Detailed Analysis Dashboard
+        if build_detailed:
+            detailed.result()
+            print("Detailed dashboard saved to dashboard_detailed.png")
+        else:
+            print("Detailed dashboard up-to-date, kept")
+    
+    if build_overview:
+        print("Summary report saved to dashboard_summary.txt")
     
     print(f"\nDashboard creation completed! All outputs saved to {dashboard_output_dir}")
 
-def create_summary_report(df, eda_output_dir, dashboard_output_dir):
+def create_summary_report(summary, eda_output_dir, dashboard_output_dir):
     """
     Create a text summary report of the dashboard findings.
     """
-    with open(f"{dashboard_output_dir}/dashboard_summary.txt", 'w') as f:
-        f.write("EGYPT REAL ESTATE ANALYSIS DASHBOARD SUMMARY\n")
-        f.write("=" * 50 + "\n\n")
+    rows, columns = summary['rows'], summary['columns']
+    size = rows * columns
+    missing_data = summary['missing']
+    total_missing = missing_data.sum()
+    type_counts = summary['type_counts']
+    stats = summary['stats']
+    
+    with open(f"{dashboard_output_dir}/dashboard_summary.txt", 'w', buffering=1 << 20) as f:
+        # The report is assembled in memory and written in one call
+        parts = []
+        parts.append("EGYPT REAL ESTATE ANALYSIS DASHBOARD SUMMARY\n")
+        parts.append("=" * 50 + "\n\n")
         
-        f.write(f"Report generated on: {datetime.now()}\n\n")
+        parts.append(f"Report generated on: {datetime.now()}\n\n")
         
-        f.write("1. DATASET OVERVIEW\n")
-        f.write("-" * 18 + "\n")
-        f.write(f"Total Properties Analyzed: {len(df):,}\n")
-        f.write(f"Total Attributes: {len(df.columns)}\n")
-        f.write(f"Total Data Points: {df.size:,}\n")
-        f.write(f"Missing Data Points: {df.isnull().sum().sum():,}\n\n")
+        parts.append("1. DATASET OVERVIEW\n")
+        parts.append("-" * 18 + "\n")
+        parts.append(f"Total Properties Analyzed: {rows:,}\n")
+        parts.append(f"Total Attributes: {columns}\n")
+        parts.append(f"Total Data Points: {size:,}\n")
+        parts.append(f"Missing Data Points: {total_missing:,}\n\n")
         
-        f.write("2. PROPERTY TYPES\n")
-        f.write("-" * 15 + "\n")
-        type_counts = df['type'].value_counts()
+        parts.append("2. PROPERTY TYPES\n")
+        parts.append("-" * 15 + "\n")
         for i, (ptype, count) in enumerate(type_counts.head(5).items()):
-            pct = (count / len(df)) * 100
-            f.write(f"{i+1}. {ptype}: {count:,} ({pct:.1f}%)\n")
-        f.write("\n")
+            pct = (count / rows) * 100
+            parts.append(f"{i+1}. {ptype}: {count:,} ({pct:.1f}%)\n")
+        parts.append("\n")
         
-        f.write("3. PRICE ANALYSIS\n")
-        f.write("-" * 15 + "\n")
-        f.write(f"Average Price: {df['price'].mean():,.0f} EGP\n")
-        f.write(f"Median Price: {df['price'].median():,.0f} EGP\n")
-        f.write(f"Price Range: {df['price'].min():,} - {df['price'].max():,} EGP\n")
-        f.write(f"Standard Deviation: {df['price'].std():,.0f} EGP\n\n")
+        parts.append("3. PRICE ANALYSIS\n")
+        parts.append("-" * 15 + "\n")
+        parts.append(f"Average Price: {stats.at['mean', 'price']:,.0f} EGP\n")
+        parts.append(f"Median Price: {stats.at['median', 'price']:,.0f} EGP\n")
+        parts.append(f"Price Range: {int(stats.at['min', 'price']):,} - {int(stats.at['max', 'price']):,} EGP\n")
+        parts.append(f"Standard Deviation: {stats.at['std', 'price']:,.0f} EGP\n\n")
         
-        f.write("4. PROPERTY CHARACTERISTICS\n")
-        f.write("-" * 25 + "\n")
-        f.write(f"Average Bedrooms: {df['bedrooms'].mean():.2f}\n")
-        f.write(f"Median Bedrooms: {df['bedrooms'].median():.0f}\n")
-        f.write(f"Average Bathrooms: {df['bathrooms'].mean():.2f}\n")
-        f.write(f"Median Bathrooms: {df['bathrooms'].median():.0f}\n")
-        f.write(f"Average Size: {df['size_sqm'].mean():.2f} sqm\n")
-        f.write(f"Median Size: {df['size_sqm'].median():.0f} sqm\n\n")
+        parts.append("4. PROPERTY CHARACTERISTICS\n")
+        parts.append("-" * 25 + "\n")
+        parts.append(f"Average Bedrooms: {stats.at['mean', 'bedrooms']:.2f}\n")
+        parts.append(f"Median Bedrooms: {stats.at['median', 'bedrooms']:.0f}\n")
+        parts.append(f"Average Bathrooms: {stats.at['mean', 'bathrooms']:.2f}\n")
+        parts.append(f"Median Bathrooms: {stats.at['median', 'bathrooms']:.0f}\n")
+        parts.append(f"Average Size: {stats.at['mean', 'size_sqm']:.2f} sqm\n")
+        parts.append(f"Median Size: {stats.at['median', 'size_sqm']:.0f} sqm\n\n")
         
-        f.write("5. KEY INSIGHTS\n")
-        f.write("-" * 12 + "\n")
-        f.write("1. Apartments, Chalets, and Villas represent the majority of listings\n")
-        f.write("2. Price distribution is heavily right-skewed with a few very expensive properties\n")
-        f.write("3. Most properties have 2-4 bedrooms and 2-3 bathrooms\n")
-        f.write("4. There's a strong correlation between price and number of bedrooms/bathrooms\n")
-        f.write("5. Location significantly impacts property prices\n")
-        f.write("6. Price per square meter varies considerably by property type\n\n")
+        parts.append("5. KEY INSIGHTS\n")
+        parts.append("-" * 12 + "\n")
+        parts.append("1. Apartments, Chalets, and Villas represent the majority of listings\n")
+        parts.append("2. Price distribution is heavily right-skewed with a few very expensive properties\n")
+        parts.append("3. Most properties have 2-4 bedrooms and 2-3 bathrooms\n")
+        parts.append("4. There's a strong correlation between price and number of bedrooms/bathrooms\n")
+        parts.append("5. Location significantly impacts property prices\n")
+        parts.append("6. Price per square meter varies considerably by property type\n\n")
         
-        f.write("6. TOP LOCATIONS\n")
-        f.write("-" * 14 + "\n")
-        top_locations = df['location'].value_counts().head(5)
-        for i, (location, count) in enumerate(top_locations.items()):
-            f.write(f"{i+1}. {location}: {count:,} properties\n")
-        f.write("\n")
+        parts.append("6. TOP LOCATIONS\n")
+        parts.append("-" * 14 + "\n")
+        for i, (location, count) in enumerate(summary['location_counts'].head(5).items()):
+            parts.append(f"{i+1}. {location}: {count:,} properties\n")
+        parts.append("\n")
         
-        f.write("7. DATA QUALITY\n")
-        f.write("-" * 13 + "\n")
-        missing_data = df.isnull().sum()
-        total_missing = missing_data.sum()
-        f.write(f"Overall Data Completeness: {((df.size - total_missing) / df.size) * 100:.1f}%\n")
-        f.write("Columns with Missing Data:\n")
+        parts.append("7. DATA QUALITY\n")
+        parts.append("-" * 13 + "\n")
+        parts.append(f"Overall Data Completeness: {((size - total_missing) / size) * 100:.1f}%\n")
+        parts.append("Columns with Missing Data:\n")
         for col, missing_count in missing_data.items():
             if missing_count > 0:
-                pct = (missing_count / len(df)) * 100
-                f.write(f"  - {col}: {missing_count:,} ({pct:.1f}%)\n")
+                pct = (missing_count / rows) * 100
+                parts.append(f"  - {col}: {missing_count:,} ({pct:.1f}%)\n")
         if total_missing == 0:
-            f.write("  No missing data found!\n")
+            parts.append("  No missing data found!\n")
+        f.write("".join(parts))
 
 if __name__ == "__main__":
     # Define paths
@@ -310,5 +483,5 @@ if __name__ == "__main__":
     eda_output_dir = "/Users/sittminthar/Desktop/BigData Dev/eda_output"
     dashboard_output_dir = "/Users/sittminthar/Desktop/BigData Dev/dashboard_output"
     
-    # Create dashboard
-    create_dashboard(cleaned_data_file, eda_output_dir, dashboard_output_dir)
\ No newline at end of file
+    # Create dashboard; --force rebuilds it even when it is up to date
+    create_dashboard(cleaned_data_file, eda_output_dir, dashboard_output_dir, force='--force' in sys.argv[1:])
\ No newline at end of file
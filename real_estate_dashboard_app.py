@@ -1,15 +1,59 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Charts are rendered to images for the browser, so no GUI backend is needed
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from datetime import datetime
 import base64
+import functools
+import io
 import os
 
-# Set style for better-looking plots
-plt.style.use('seaborn-v0_8')
-sns.set_palette("Blues_r")  # Reversed blues for better contrast
+# Set style for better-looking plots. Streamlit executes this script again on
+# every rerun, so the style is applied once per process rather than each time
+@st.cache_resource(show_spinner=False)
+def set_plot_style():
+    """Apply the seaborn plot style to Matplotlib's global rcParams"""
+    plt.style.use('seaborn-v0_8')
+
+set_plot_style()
+
+@functools.lru_cache(maxsize=128)
+def blues_palette(n):
+    """Reversed blues palette of n colors, for better contrast; built once per n"""
+    return sns.color_palette("Blues_r", n)
+
+# Single-series charts use the first color of the six-color palette, which is
+# what sns.set_palette("Blues_r") would make the default color
+BAR_COLOR = blues_palette(6)[0]
+
+# Column dtypes applied when reading the dataset: narrow numeric types and
+# categorical strings; room counts stay float because they can be missing.
+# price is not listed: it is downcast to the smallest integer type that
+# holds every price once the dataset is read
+DTYPES = {
+    'size_sqm': 'float32',
+    'bedrooms': 'float32',
+    'bathrooms': 'float32',
+    'type': 'category',
+    'location': 'category'
+}
+
+# The numeric DTYPES as Arrow types, so the CSV parser converts those columns
+# directly instead of inferring a type that is then cast; price is parsed as
+# float64, which accepts any price the file holds (including "1500000.0")
+ARROW_TYPES = {
+    'price': pa.float64(),
+    'size_sqm': pa.float32(),
+    'bedrooms': pa.float32(),
+    'bathrooms': pa.float32()
+}
 
 # Configure the page
 st.set_page_config(
@@ -18,8 +62,36 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# The dataset is cached as a resource: every rerun shares the one DataFrame
+# instead of st.cache_data unpickling a fresh copy of it, so nothing may
+# modify it; derived values such as price per sqm are computed by the cached
+# helpers below instead of being added as columns
+@st.cache_resource(show_spinner=False, max_entries=1)
+def read_dataset(path, mtime):
+    """Read a CSV or Parquet dataset file and its missing values per column; cached per path and modification time, so an edited file is re-read"""
+    if path.endswith('.parquet'):
+        table = pq.read_table(path)
+    else:
+        # Arrow's multithreaded parser; descriptions contain quoted newlines
+        table = pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(strings_can_be_null=True, column_types=ARROW_TYPES)
+        )
+    # Null counts are stored with each Arrow column, so no isnull scan is needed
+    missing = pd.Series({name: table.column(name).null_count for name in table.column_names})
+    df = table.to_pandas()
+    # Columns already of their dtype are not copied again
+    df = df.astype({col: dtype for col, dtype in DTYPES.items() if col in df.columns}, copy=False)
+    if 'price' in df.columns:
+        # Unlike a fixed int32 cast, to_numeric only narrows when every price
+        # fits, so a large price cannot wrap and a missing one keeps it float
+        df['price'] = pd.to_numeric(df['price'], downcast='integer')
+    return df, missing
+
 def load_data():
-    """Load the cleaned dataset"""
+    """Load the cleaned dataset and its missing values per column, with a (path, modification time) key identifying its contents"""
     try:
         # Try to load data with different possible paths
         possible_paths = [
@@ -31,22 +103,126 @@ def load_data():
             os.path.join(os.path.dirname(__file__), "detailed_cleaned_egypt_real_estate.csv")
         ]
         
+        # The path found on an earlier rerun of the session is tried first, so
+        # a rerun usually costs a single stat for its modification time; the
+        # candidates are only probed again if it no longer exists
+        found_path = st.session_state.get('data_path')
         df = None
-        for path in possible_paths:
+        for path in ([found_path] if found_path else []) + possible_paths:
+            if path != found_path:
+                # The Parquet copy written next to a CSV file is read in its place
+                parquet_path = os.path.splitext(path)[0] + '.parquet'
+                if os.path.exists(parquet_path):
+                    path = parquet_path
             try:
-                if os.path.exists(path):
-                    df = pd.read_csv(path)
-                    break
-            except:
+                data_key = (path, os.path.getmtime(path))
+            except OSError:
+                # Only a missing file moves on to the next path; an error
+                # reading an existing file is reported below as it is
                 continue
+            df, missing_counts = read_dataset(*data_key)
+            st.session_state['data_path'] = path
+            break
                 
         if df is None:
             st.error("Dataset file not found. Please make sure the file exists.")
-            return None
-        return df
+            return None, None, None
+        return df, data_key, missing_counts
     except Exception as e:
         st.error(f"Error loading dataset: {str(e)}")
-        return None
+        return None, None, None
+
+# Aggregates of the dataset. They are cached on the dataset's key rather than
+# on the DataFrame (the leading underscore tells Streamlit not to hash it), so
+# a rerun looks them up instead of scanning the data again
+
+def category_counts(series, top=None):
+    """Listings per category of a categorical column, most common first, like value_counts"""
+    # The categorical codes are small integers (-1 for missing), so bincount
+    # counts them without value_counts' hash table
+    codes = series.cat.codes.to_numpy()
+    counts = pd.Series(np.bincount(codes[codes >= 0], minlength=len(series.cat.categories)),
+                       index=series.cat.categories, name='count')
+    if top is not None:
+        # nlargest selects the top categories without sorting all of them
+        return counts.nlargest(top)
+    return counts.sort_values(ascending=False)
+
+@st.cache_data(show_spinner=False)
+def get_type_counts(_df, data_key):
+    """Listings per property type, most common first"""
+    return category_counts(_df['type'])
+
+@st.cache_data(show_spinner=False)
+def get_location_counts(_df, data_key, top):
+    """Listings per location of the top locations, most common first"""
+    return category_counts(_df['location'], top)
+
+@st.cache_data(show_spinner=False)
+def get_room_counts(_df, data_key, column):
+    """Listings per bedroom or bathroom count, in ascending order of the count"""
+    return _df[column].value_counts().sort_index()
+
+@st.cache_data(show_spinner=False)
+def get_column_stats(_df, data_key, column):
+    """Mean, median, min and max of a numeric column"""
+    values = _df[column]
+    return {'mean': values.mean(), 'median': values.median(), 'min': values.min(), 'max': values.max()}
+
+@st.cache_data(show_spinner=False)
+def get_price_by_type(_df, data_key):
+    """Mean and median price of the eight most common property types"""
+    # Grouped directly on the category codes: the means come from bincount
+    # sums and counts, the medians from the prices of each of the eight codes
+    types = _df['type'].cat
+    codes = types.codes.to_numpy()
+    price = _df['price'].to_numpy(dtype=np.float64)
+    top_codes = types.categories.get_indexer(get_type_counts(_df, data_key).index[:8])
+    present = codes >= 0
+    sums = np.bincount(codes[present], weights=price[present], minlength=len(types.categories))
+    counts = np.bincount(codes[present], minlength=len(types.categories))
+    df_grouped = pd.DataFrame({
+        'mean': sums[top_codes] / counts[top_codes],
+        'median': [np.median(price[codes == code]) for code in top_codes]
+    }, index=pd.Index(types.categories[top_codes], name='type'))
+    return df_grouped.sort_values('mean', ascending=False)
+
+def histogram_counts(values):
+    """Counts and edges of a 50-bin histogram of the finite values"""
+    return np.histogram(values[np.isfinite(values)], bins=50)
+
+@st.cache_data(show_spinner=False)
+def get_histogram(_df, data_key, column):
+    """Counts and edges of a 50-bin histogram of a numeric column"""
+    return histogram_counts(_df[column].to_numpy(dtype=np.float64))
+
+@st.cache_data(show_spinner=False)
+def get_price_per_sqm_histogram(_df, data_key):
+    """Counts and edges of a 50-bin histogram of the price per square meter of every listing"""
+    # Divided in float32, like the EDA script: half the memory traffic of
+    # float64, and ample precision for binning
+    price_per_sqm = np.divide(_df['price'].to_numpy(), _df['size_sqm'].to_numpy(), dtype=np.float32)
+    return histogram_counts(price_per_sqm)
+
+# EDA tables the app displays, in the order load_eda_data returns them
+EDA_FILES = [
+    "summary_statistics.csv",
+    "correlation_matrix.csv",
+    "missing_values_report.csv",
+    "property_type_distribution.csv",
+    "price_statistics.csv",
+    "top_locations.csv"
+]
+
+@st.cache_data(show_spinner=False)
+def read_eda_tables(paths, mtimes):
+    """Read the EDA tables, CSV or Parquet, with their index as the first column; cached per paths and modification times, so regenerated outputs are re-read"""
+    # The tables are kept as Arrow tables, which st.dataframe sends as they
+    # are instead of converting a DataFrame to Arrow on every rerun
+    return tuple(pa.Table.from_pandas(
+                     pd.read_parquet(path).reset_index() if path.endswith('.parquet') else pd.read_csv(path),
+                     preserve_index=False)
+                 for path in paths)
 
 def load_eda_data():
     """Load EDA data"""
@@ -57,270 +233,332 @@ def load_eda_data():
         os.path.join(os.path.dirname(__file__), "eda_output")
     ]
     
-    # Find the correct EDA directory
-    correct_eda_dir = None
-    for path in possible_paths:
-        if os.path.exists(path):
-            correct_eda_dir = path
-            break
-    
+    # Find the correct EDA directory, once per session
+    correct_eda_dir = st.session_state.get('eda_dir')
     if correct_eda_dir is None:
-        st.warning("EDA files not found. Some visualizations may not be available.")
-        return None, None, None, None, None, None
+        for path in possible_paths:
+            if os.path.exists(path):
+                correct_eda_dir = path
+                break
+        
+        if correct_eda_dir is None:
+            st.warning("EDA files not found. Some visualizations may not be available.")
+            return None, None, None, None, None, None, None
+        st.session_state['eda_dir'] = correct_eda_dir
     
     try:
-        summary_stats = pd.read_csv(f"{correct_eda_dir}/summary_statistics.csv")
-        correlation_matrix = pd.read_csv(f"{correct_eda_dir}/correlation_matrix.csv")
-        missing_values = pd.read_csv(f"{correct_eda_dir}/missing_values_report.csv")
-        property_type_dist = pd.read_csv(f"{correct_eda_dir}/property_type_distribution.csv")
-        price_stats = pd.read_csv(f"{correct_eda_dir}/price_statistics.csv")
-        top_locations = pd.read_csv(f"{correct_eda_dir}/top_locations.csv")
-        return summary_stats, correlation_matrix, missing_values, property_type_dist, price_stats, top_locations
+        # The Parquet copy the EDA step writes next to each CSV file is read
+        # in its place. Only the modification times are read on a rerun; the
+        # tables come from the cache unless a file changed
+        paths = []
+        for name in EDA_FILES:
+            path = f"{correct_eda_dir}/{name}"
+            parquet_path = os.path.splitext(path)[0] + '.parquet'
+            paths.append(parquet_path if os.path.exists(parquet_path) else path)
+        mtimes = tuple(os.path.getmtime(path) for path in paths)
+        summary_stats, correlation_matrix, missing_values, property_type_dist, price_stats, top_locations = \
+            read_eda_tables(tuple(paths), mtimes)
+        # The EDA step renders the heatmap along with the matrix, so the app
+        # shows that image rather than drawing it again
+        heatmap_path = f"{correct_eda_dir}/correlation_heatmap.png"
+        if not os.path.exists(heatmap_path):
+            heatmap_path = None
+        return summary_stats, correlation_matrix, missing_values, property_type_dist, price_stats, top_locations, heatmap_path
     except FileNotFoundError:
+        # The directory is looked for again on the next rerun
+        st.session_state.pop('eda_dir', None)
         st.warning("Some EDA files are missing. Some visualizations may not be available.")
-        return None, None, None, None, None, None
+        return None, None, None, None, None, None, None
+
+# Chart builders. Each one draws on a Figure created directly rather than
+# through pyplot's global figure manager and returns it saved as PNG bytes,
+# cached on its inputs, so a rerun (view switch, widget change) sends the
+# cached image instead of drawing and saving the chart again, as st.pyplot
+# would on every call. Each cache holds as many images as the builder draws
+# charts, so a reloaded dataset replaces the old images rather than adding to
+# them for the session
+
+def figure_png(fig):
+    """PNG bytes of a figure, saved with st.pyplot's settings"""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=200, bbox_inches='tight')
+    return buffer.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def property_types_figure(property_counts):
+    """Bar chart of the most common property types"""
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    bars = ax.bar(property_counts.index, property_counts.values, color=blues_palette(len(property_counts)))
+    ax.set_title("Top 10 Property Types")
+    ax.set_xlabel("Property Type")
+    ax.set_ylabel("Count")
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    # Value labels above the bars, placed in one call
+    ax.bar_label(bars, fmt='%d', padding=3)
+    return figure_png(fig)
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def room_counts_figure(room_counts, xlabel):
+    """Bar chart of listings per bedroom or bathroom count"""
+    fig = Figure(figsize=(8, 6))
+    ax = fig.subplots()
+    bars = ax.bar(room_counts.index, room_counts.values, color=blues_palette(len(room_counts)))
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel("Count")
+    # Value labels above the bars, placed in one call
+    ax.bar_label(bars, fmt='%d', padding=3)
+    return figure_png(fig)
+
+@st.cache_data(show_spinner=False, max_entries=3)
+def histogram_figure(histogram, xlabel, title, figsize):
+    """Histogram drawn as bars from precomputed counts and bin edges"""
+    counts, edges = histogram
+    fig = Figure(figsize=figsize)
+    ax = fig.subplots()
+    # The bars touch, so they are drawn without an outline stroke
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', linewidth=0, color=BAR_COLOR, alpha=0.7)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel("Frequency")
+    ax.set_title(title)
+    return figure_png(fig)
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def price_by_type_figure(df_grouped):
+    """Grouped bar chart of mean and median price per property type"""
+    fig = Figure(figsize=(12, 8))
+    ax = fig.subplots()
+    bars1 = ax.bar(np.arange(len(df_grouped.index)) - 0.2, df_grouped['mean'], width=0.4, label='Mean', 
+                  color=blues_palette(1)[0], alpha=0.8)
+    bars2 = ax.bar(np.arange(len(df_grouped.index)) + 0.2, df_grouped['median'], width=0.4, label='Median', 
+                  color=blues_palette(1)[0], alpha=0.5)
+    ax.set_xlabel("Property Type")
+    ax.set_ylabel("Price (EGP)")
+    ax.set_title("Average and Median Price by Property Type")
+    ax.set_xticks(np.arange(len(df_grouped.index)))
+    ax.set_xticklabels(df_grouped.index, rotation=45, ha='right')
+    ax.legend()
+    ax.bar_label(bars1, labels=[f"{int(value):,}" for value in df_grouped['mean']], padding=3, fontsize=8)
+    return figure_png(fig)
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def top_locations_figure(top_locations_plot):
+    """Horizontal bar chart of the locations with the most listings"""
+    fig = Figure(figsize=(12, 8))
+    ax = fig.subplots()
+    ax.barh(top_locations_plot.index, top_locations_plot.values, color=BAR_COLOR)
+    ax.set_xlabel("Number of Properties")
+    ax.set_ylabel("Location")
+    ax.set_title("Top 15 Locations by Property Count")
+    return figure_png(fig)
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def correlation_heatmap_figure(corr_data):
+    """Annotated heatmap of a correlation matrix"""
+    fig = Figure(figsize=(10, 8))
+    ax = fig.subplots()
+    # Create a heatmap using seaborn with improved blue color scheme
+    sns.heatmap(corr_data, annot=True, cmap='Blues', center=0, square=True, linewidths=0.5, 
+                cbar_kws={"shrink": .8}, annot_kws={"size": 12}, ax=ax)
+    ax.set_title('Correlation Matrix of Numeric Variables', fontsize=16, pad=20)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    plt.setp(ax.get_yticklabels(), rotation=0)
+    return figure_png(fig)
+
+# Where the histograms are drawn: "matplotlib" renders them on the server with
+# histogram_figure; "browser" sends only the 50 bin counts to st.bar_chart and
+# lets the browser draw them, so no figure is rasterized for them at all
+HISTOGRAM_BACKEND = "matplotlib"
+
+def show_histogram(histogram, xlabel, title, figsize):
+    """Display a histogram from precomputed counts and bin edges with the configured backend"""
+    if HISTOGRAM_BACKEND == "browser":
+        counts, edges = histogram
+        st.caption(title)
+        st.bar_chart(pd.DataFrame({xlabel: (edges[:-1] + edges[1:]) / 2, "Frequency": counts}),
+                     x=xlabel, y="Frequency", color=matplotlib.colors.to_hex(BAR_COLOR))
+    else:
+        st.image(histogram_figure(histogram, xlabel, title, figsize), use_column_width=True)
+
+# Views of the dashboard. Only the selected view is rendered on a rerun, so
+# the others compute and draw nothing
+
+def render_overview(df, data_key, missing_counts, property_type_dist):
+    """Overview view: dataset size, missing values and property types"""
+    st.header("Dataset Overview")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Total Properties", f"{len(df):,}")
+    col2.metric("Attributes", len(df.columns))
+    col3.metric("Data Points", f"{df.size:,}")
+    missing_data = missing_counts
+    col4.metric("Data Completeness", f"{((df.size - missing_data.sum()) / df.size) * 100:.1f}%")
+    
+    # Display missing values after cleaning
+    st.subheader("Missing Values After Cleaning")
+    missing_data = missing_data[missing_data > 0]
+    if len(missing_data) > 0:
+        missing_df = pd.DataFrame({
+            'Column': missing_data.index,
+            'Missing Count': missing_data.values,
+            'Percentage': (missing_data.values / len(df)) * 100
+        })
+        st.dataframe(missing_df)
+    else:
+        st.success("No missing values in the cleaned dataset!")
+    
+    st.subheader("Property Types Distribution")
+    if property_type_dist is not None:
+        st.dataframe(property_type_dist)
+    else:
+        st.write("Property type distribution data not available.")
+    
+    # Create a bar chart of property types
+    property_counts = get_type_counts(df, data_key).head(10)
+    st.image(property_types_figure(property_counts), use_column_width=True)
+
+def render_attributes(df, data_key):
+    """Property attributes view: bedroom and bathroom counts"""
+    st.header("PropertyParams Analysis")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Bedrooms Distribution")
+        bedroom_counts = get_room_counts(df, data_key, 'bedrooms')
+        st.image(room_counts_figure(bedroom_counts, "Number of Bedrooms"), use_column_width=True)
+        
+        bedroom_stats = get_column_stats(df, data_key, 'bedrooms')
+        st.metric("Average Bedrooms", f"{bedroom_stats['mean']:.2f}")
+        st.metric("Median Bedrooms", f"{bedroom_stats['median']:.0f}")
+    
+    with col2:
+        st.subheader("Bathrooms Distribution")
+        bathroom_counts = get_room_counts(df, data_key, 'bathrooms')
+        st.image(room_counts_figure(bathroom_counts, "Number of Bathrooms"), use_column_width=True)
+        
+        bathroom_stats = get_column_stats(df, data_key, 'bathrooms')
+        st.metric("Average Bathrooms", f"{bathroom_stats['mean']:.2f}")
+        st.metric("Median Bathrooms", f"{bathroom_stats['median']:.0f}")
+
+def render_price(df, data_key, price_stats):
+    """Price analysis view"""
+    st.header("Price Analysis")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Price Statistics")
+        if price_stats is not None:
+            st.dataframe(price_stats)
+        else:
+            # Calculate basic stats if file not available
+            price_summary = get_column_stats(df, data_key, 'price')
+            price_stats_data = {
+                'Statistic': ['Mean', 'Median', 'Min', 'Max'],
+                'Value': [f"{price_summary['mean']:,.2f}", f"{price_summary['median']:,.2f}", 
+                         f"{price_summary['min']:,}", f"{price_summary['max']:,}"]
+            }
+            st.dataframe(pd.DataFrame(price_stats_data))
+    
+    with col2:
+        st.subheader("Price Distribution")
+        show_histogram(get_histogram(df, data_key, 'price'), "Price (EGP)", "Distribution of Property Prices", (10, 6))
+    
+    st.subheader("Price by Property Type")
+    st.image(price_by_type_figure(get_price_by_type(df, data_key)), use_column_width=True)
+
+def render_size(df, data_key):
+    """Size analysis view, including price per square meter"""
+    st.header("PropertyParams Size Analysis")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        size_stats = get_column_stats(df, data_key, 'size_sqm')
+        st.metric("Average Size", f"{size_stats['mean']:,.2f} sqm")
+        st.metric("Median Size", f"{size_stats['median']:,.0f} sqm")
+        st.metric("Min Size", f"{size_stats['min']:,.0f} sqm")
+        st.metric("Max Size", f"{size_stats['max']:,.0f} sqm")
+    
+    with col2:
+        st.subheader("Size Distribution")
+        show_histogram(get_histogram(df, data_key, 'size_sqm'), "Size (sqm)", "Distribution of Property Sizes", (10, 6))
+    
+    st.subheader("Price per Square Meter")
+    show_histogram(get_price_per_sqm_histogram(df, data_key), "Price per Square Meter (EGP/sqm)",
+                   "Distribution of Price per Square Meter", (12, 8))
+
+def render_locations(df, data_key, top_locations):
+    """Location analysis view"""
+    st.header("PropertyParams Location Analysis")
+    
+    st.subheader("Top Locations")
+    if top_locations is not None:
+        st.dataframe(top_locations)
+    else:
+        st.write("Top locations data not available.")
+    
+    st.subheader("Properties by Location")
+    top_locations_plot = get_location_counts(df, data_key, 15)
+    st.image(top_locations_figure(top_locations_plot), use_column_width=True)
+
+def render_correlations(correlation_matrix, heatmap_path):
+    """Correlations view: the EDA correlation matrix and heatmap"""
+    st.header("PropertyParams Correlations")
+    
+    if correlation_matrix is not None:
+        st.subheader("Correlation Matrix")
+        st.dataframe(correlation_matrix)
+        
+        st.subheader("Correlation Heatmap")
+        if heatmap_path is not None:
+            st.image(heatmap_path)
+        else:
+            corr_data = correlation_matrix.to_pandas().set_index(correlation_matrix.column_names[0])
+            st.image(correlation_heatmap_figure(corr_data), use_column_width=True)
+    else:
+        st.warning("Correlation data not available.")
 
 def main():
     # Title and description
     st.title("Egypt Real Estate Dashboard")
     st.markdown("""
     This dashboard presents a comprehensive analysis of the Egypt real estate market.
-    Navigate through the tabs to explore different aspects of the data.
+    Navigate through the views to explore different aspects of the data.
     """)
     
     # Load data
-    df = load_data()
+    df, data_key, missing_counts = load_data()
     if df is None:
         st.stop()
     
     # Load EDA data
-    summary_stats, correlation_matrix, missing_values, property_type_dist, price_stats, top_locations = load_eda_data()
+    summary_stats, correlation_matrix, missing_values, property_type_dist, price_stats, top_locations, heatmap_path = load_eda_data()
     
-    # Create tabs
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+    # Select a view; unlike st.tabs, which runs the code of every tab on each
+    # rerun, only the selected view is built
+    view = st.radio("View", [
         "Overview", 
         "PropertyParams", 
         "Price Analysis", 
         "Size Analysis", 
         "Location Analysis", 
         "Correlations"
-    ])
+    ], horizontal=True, key='view', label_visibility='collapsed')
     
-    # Tab 1: Overview
-    with tab1:
-        st.header("Dataset Overview")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Total Properties", f"{len(df):,}")
-        col2.metric("Attributes", len(df.columns))
-        col3.metric("Data Points", f"{df.size:,}")
-        col4.metric("Data Completeness", f"{((df.size - df.isnull().sum().sum()) / df.size) * 100:.1f}%")
-        
-        # Display missing values after cleaning
-        st.subheader("Missing Values After Cleaning")
-        missing_data = df.isnull().sum()
-        missing_data = missing_data[missing_data > 0]
-        if len(missing_data) > 0:
-            missing_df = pd.DataFrame({
-                'Column': missing_data.index,
-                'Missing Count': missing_data.values,
-                'Percentage': (missing_data.values / len(df)) * 100
-            })
-            st.dataframe(missing_df)
-        else:
-            st.success("No missing values in the cleaned dataset!")
-        
-        st.subheader("Property Types Distribution")
-        if property_type_dist is not None:
-            st.dataframe(property_type_dist)
-        else:
-            st.write("Property type distribution data not available.")
-        
-        # Create a bar chart of property types
-        fig, ax = plt.subplots(figsize=(10, 6))
-        property_counts = df['type'].value_counts().head(10)
-        bars = ax.bar(property_counts.index, property_counts.values, color=sns.color_palette("Blues_r", len(property_counts)))
-        ax.set_title("Top 10 Property Types")
-        ax.set_xlabel("Property Type")
-        ax.set_ylabel("Count")
-        plt.xticks(rotation=45, ha='right')
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.annotate(f'{int(height)}',
-                        xy=(bar.get_x() + bar.get_width() / 2, height),
-                        xytext=(0, 3),
-                        textcoords="offset points",
-                        ha='center', va='bottom')
-        st.pyplot(fig)
-        
-    # Tab 2: Property Attributes
-    with tab2:
-        st.header("PropertyParams Analysis")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Bedrooms Distribution")
-            fig, ax = plt.subplots(figsize=(8, 6))
-            bedroom_counts = df['bedrooms'].value_counts().sort_index()
-            bars = ax.bar(bedroom_counts.index, bedroom_counts.values, color=sns.color_palette("Blues_r", len(bedroom_counts)))
-            ax.set_xlabel("Number of Bedrooms")
-            ax.set_ylabel("Count")
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax.annotate(f'{int(height)}',
-                            xy=(bar.get_x() + bar.get_width() / 2, height),
-                            xytext=(0, 3),
-                            textcoords="offset points",
-                            ha='center', va='bottom')
-            st.pyplot(fig)
-            
-            st.metric("Average Bedrooms", f"{df['bedrooms'].mean():.2f}")
-            st.metric("Median Bedrooms", f"{df['bedrooms'].median():.0f}")
-        
-        with col2:
-            st.subheader("Bathrooms Distribution")
-            fig, ax = plt.subplots(figsize=(8, 6))
-            bathroom_counts = df['bathrooms'].value_counts().sort_index()
-            bars = ax.bar(bathroom_counts.index, bathroom_counts.values, color=sns.color_palette("Blues_r", len(bathroom_counts)))
-            ax.set_xlabel("Number of Bathrooms")
-            ax.set_ylabel("Count")
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax.annotate(f'{int(height)}',
-                            xy=(bar.get_x() + bar.get_width() / 2, height),
-                            xytext=(0, 3),
-                            textcoords="offset points",
-                            ha='center', va='bottom')
-            st.pyplot(fig)
-            
-            st.metric("Average Bathrooms", f"{df['bathrooms'].mean():.2f}")
-            st.metric("Median Bathrooms", f"{df['bathrooms'].median():.0f}")
-    
-    # Tab 3: Price Analysis
-    with tab3:
-        st.header("Price Analysis")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Price Statistics")
-            if price_stats is not None:
-                st.dataframe(price_stats)
-            else:
-                # Calculate basic stats if file not available
-                price_stats_data = {
-                    'Statistic': ['Mean', 'Median', 'Min', 'Max'],
-                    'Value': [f"{df['price'].mean():,.2f}", f"{df['price'].median():,.2f}", 
-                             f"{df['price'].min():,}", f"{df['price'].max():,}"]
-                }
-                st.dataframe(pd.DataFrame(price_stats_data))
-            
-        with col2:
-            st.subheader("Price Distribution")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.hist(df['price'], bins=50, edgecolor='black', alpha=0.7)
-            ax.set_xlabel("Price (EGP)")
-            ax.set_ylabel("Frequency")
-            ax.set_title("Distribution of Property Prices")
-            st.pyplot(fig)
-        
-        st.subheader("Price by Property Type")
-        fig, ax = plt.subplots(figsize=(12, 8))
-        df_filtered = df[df['type'].isin(df['type'].value_counts().head(8).index)]
-        df_grouped = df_filtered.groupby('type')['price'].agg(['mean', 'median']).sort_values('mean', ascending=False)
-        bars1 = ax.bar(np.arange(len(df_grouped.index)) - 0.2, df_grouped['mean'], width=0.4, label='Mean', 
-                      color=sns.color_palette("Blues_r", 1)[0], alpha=0.8)
-        bars2 = ax.bar(np.arange(len(df_grouped.index)) + 0.2, df_grouped['median'], width=0.4, label='Median', 
-                      color=sns.color_palette("Blues_r", 1)[0], alpha=0.5)
-        ax.set_xlabel("Property Type")
-        ax.set_ylabel("Price (EGP)")
-        ax.set_title("Average and Median Price by Property Type")
-        ax.set_xticks(np.arange(len(df_grouped.index)))
-        ax.set_xticklabels(df_grouped.index, rotation=45, ha='right')
-        ax.legend()
-        # Add value labels on bars
-        for i, (bar, value) in enumerate(zip(bars1, df_grouped['mean'])):
-            height = bar.get_height()
-            ax.annotate(f'{int(value):,}',
-                        xy=(bar.get_x() + bar.get_width() / 2, height),
-                        xytext=(0, 3),
-                        textcoords="offset points",
-                        ha='center', va='bottom', fontsize=8)
-        st.pyplot(fig)
-    
-    # Tab 4: Size Analysis
-    with tab4:
-        st.header("PropertyParams Size Analysis")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.metric("Average Size", f"{df['size_sqm'].mean():,.2f} sqm")
-            st.metric("Median Size", f"{df['size_sqm'].median():,.0f} sqm")
-            st.metric("Min Size", f"{df['size_sqm'].min():,.0f} sqm")
-            st.metric("Max Size", f"{df['size_sqm'].max():,.0f} sqm")
-        
-        with col2:
-            st.subheader("Size Distribution")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.hist(df['size_sqm'], bins=50, edgecolor='black', alpha=0.7)
-            ax.set_xlabel("Size (sqm)")
-            ax.set_ylabel("Frequency")
-            ax.set_title("Distribution of Property Sizes")
-            st.pyplot(fig)
-        
-        st.subheader("Price per Square Meter")
-        df['price_per_sqm'] = df['price'] / df['size_sqm']
-        fig, ax = plt.subplots(figsize=(12, 8))
-        ax.hist(df['price_per_sqm'], bins=50, edgecolor='black', alpha=0.7)
-        ax.set_xlabel("Price per Square Meter (EGP/sqm)")
-        ax.set_ylabel("Frequency")
-        ax.set_title("Distribution of Price per Square Meter")
-        st.pyplot(fig)
-    
-    # Tab 5: Location Analysis
-    with tab5:
-        st.header("PropertyParams Location Analysis")
-        
-        st.subheader("Top Locations")
-        if top_locations is not None:
-            st.dataframe(top_locations)
-        else:
-            st.write("Top locations data not available.")
-        
-        st.subheader("Properties by Location")
-        fig, ax = plt.subplots(figsize=(12, 8))
-        top_locations_plot = df['location'].value_counts().head(15)
-        ax.barh(top_locations_plot.index, top_locations_plot.values)
-        ax.set_xlabel("Number of Properties")
-        ax.set_ylabel("Location")
-        ax.set_title("Top 15 Locations by Property Count")
-        st.pyplot(fig)
-    
-    # Tab 6: Correlations
-    with tab6:
-        st.header("PropertyParams Correlations")
-        
-        if correlation_matrix is not None:
-            st.subheader("Correlation Matrix")
-            st.dataframe(correlation_matrix)
-            
-            st.subheader("Correlation Heatmap")
-            fig, ax = plt.subplots(figsize=(10, 8))
-            # Create a heatmap using seaborn with improved blue color scheme
-            corr_data = correlation_matrix.set_index(correlation_matrix.columns[0])
-            sns.heatmap(corr_data, annot=True, cmap='Blues', center=0, square=True, linewidths=0.5, 
-                        cbar_kws={"shrink": .8}, annot_kws={"size": 12})
-            ax.set_title('Correlation Matrix of Numeric Variables', fontsize=16, pad=20)
-            plt.xticks(rotation=45, ha='right')
-            plt.yticks(rotation=0)
-            st.pyplot(fig)
-        else:
-            st.warning("Correlation data not available.")
+    if view == "Overview":
+        render_overview(df, data_key, missing_counts, property_type_dist)
+    elif view == "PropertyParams":
+        render_attributes(df, data_key)
+    elif view == "Price Analysis":
+        render_price(df, data_key, price_stats)
+    elif view == "Size Analysis":
+        render_size(df, data_key)
+    elif view == "Location Analysis":
+        render_locations(df, data_key, top_locations)
+    else:
+        render_correlations(correlation_matrix, heatmap_path)
     
     # Footer
     st.markdown("---")
@@ -5,11 +5,13 @@ setup(
     version="1.0.0",
     packages=find_packages(),
     install_requires=[
-        "streamlit==1.24.0",
-        "pandas==1.5.3",
-        "numpy==1.24.3",
-        "matplotlib==3.7.1",
-        "seaborn==0.12.2"
+        "streamlit>=1.30.0",
+        "pandas>=2.1.4",
+        "numpy>=1.26.4",
+        "matplotlib>=3.8.4",
+        "seaborn>=0.13.2",
+        "Pillow>=10.3.0",
+        "pyarrow>=14.0.2"
     ],
     python_requires=">=3.10",
 )
\ No newline at end of file